@@ -12,19 +12,77 @@ from datetime import datetime
 import threading
 import queue
 import os
+import io
+import concurrent.futures
+from functools import lru_cache
 from pathlib import Path
 
 from job_manager import JobManager
-from scheduler_engine import SchedulerEngine
-from workflow_canvas import WorkflowCanvas
-from job_dialog import JobDialog
-from log_viewer import LogViewer
-from settings_dialog import SettingsDialog
+from scheduler_engine import SchedulerEngine, lower_thread_priority
+
+# Dialogs, the workflow designer and the canvas job list are imported where
+# they are first used so startup only pays for the main window
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fast JSON decoding when orjson is installed; both accept str or bytes
+_json_loads = orjson.loads if orjson else json.loads
+
+# Job list widget: True/False forces the canvas list or the Treeview,
+# None picks the canvas list once there are more than VIRTUAL_LIST_THRESHOLD jobs
+USE_VIRTUAL_LIST = None
+VIRTUAL_LIST_THRESHOLD = 500
+
+_SEP = '=' * 80
+
+# Lookup tables indexed by a job's boolean flags
+_STATUS_ICON = ("⏸️", "✅")
+_YESNO = ('No', 'Yes')
+
+# Schedule column formats keyed by schedule type: (format, field that must be set)
+_SCHEDULE_FMTS = {
+    'cron': ('Cron: {cron_expression}', 'cron_expression'),
+    'interval': ('Every {interval_minutes}m', 'interval_minutes'),
+}
+
+
+@lru_cache(maxsize=None)
+def _header(title):
+    """Section header for the details and dependency views, built once per title"""
+    return f"\n{title}\n{_SEP}\n"
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value):
+    """Parse an ISO timestamp, memoized since many rows share the same values"""
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=8192)
+def _fmt_ts(value):
+    """Return (datetime or None, display text) for a job list timestamp"""
+    try:
+        dt = _parse_timestamp(value)
+    except ValueError:
+        return None, value
+    return dt, dt.strftime('%Y-%m-%d %H:%M')
 
 
 class ETLSchedulerApp:
     """Main application class for ETL Scheduler"""
     
+    # Milliseconds between drains of the status queue; updates arriving in between are
+    # folded into one refresh per job
+    STATUS_POLL_MS = 100
+    
     def __init__(self, root):
         self.root = root
         self.root.title("ETL Job Scheduler & Orchestrator")
@@ -37,6 +95,42 @@ class ETLSchedulerApp:
         # Status update queue for thread-safe UI updates
         self.status_queue = queue.Queue()
         
+        # Last rendered (icon, values) per job id, used to diff the job list
+        self._job_row_cache = {}
+        
+        # (iid, lowercased row text) pairs in display order, used by the search filter
+        self._search_index = []
+        self._filter_after_id = None
+        
+        # Typed sort keys per row and the current direction per column
+        self._row_data = {}
+        self._sort_reverse = {}
+        
+        # (column index, reverse) of the last column sort, reapplied on refresh; None for name order
+        self._sort = None
+        
+        # Job currently selected in the list, kept fresh by the refresh methods
+        self._selected_job = None
+        self._selected_job_id = None
+        
+        # Write-behind queue of (job_id, field, value) updates, flushed in one transaction
+        self._write_queue = []
+        self._write_pending = False
+        
+        # Direct and transitive upstream dependencies per job, rebuilt with the job list
+        self._dep_graph = {}
+        self._transitive = {}
+        
+        # Open workflow designers, which recolor job boxes as statuses change
+        self._workflow_canvases = []
+        
+        # Background workers for database reads that feed the UI
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        
+        # Bounded pool for manually triggered job runs
+        self._exec_pool = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix='etl-job',
+                                                                initializer=lower_thread_priority)
+        
         # Setup UI
         self.setup_menu()
         self.setup_ui()
@@ -47,7 +141,7 @@ class ETLSchedulerApp:
         # Start scheduler
         self.scheduler_engine.start()
         
-        # Start status update checker
+        # Start draining status updates posted by worker threads
         self.check_status_updates()
         
         # Handle window close
@@ -117,16 +211,24 @@ class ETLSchedulerApp:
         search_frame.pack(fill=tk.X, padx=5, pady=5)
         ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT)
         self.search_var = tk.StringVar()
-        self.search_var.trace('w', lambda *args: self.filter_jobs())
+        self.search_var.trace('w', lambda *args: self.schedule_filter())
         ttk.Entry(search_frame, textvariable=self.search_var).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         
         # Job list
         list_frame = ttk.LabelFrame(left_frame, text="Jobs", padding=5)
         list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Treeview for jobs
+        # Treeview for jobs, or a virtualized canvas list for large job sets
         columns = ("Name", "Type", "Schedule", "Status", "Last Run", "Next Run")
-        self.job_tree = ttk.Treeview(list_frame, columns=columns, show="tree headings", selectmode="browse")
+        use_virtual = USE_VIRTUAL_LIST
+        if use_virtual is None:
+            use_virtual = self.job_manager.get_job_count() > VIRTUAL_LIST_THRESHOLD
+            
+        if use_virtual:
+            from virtual_list import VirtualJobList
+            self.job_tree = VirtualJobList(list_frame, columns=columns)
+        else:
+            self.job_tree = ttk.Treeview(list_frame, columns=columns, show="tree headings", selectmode="browse")
         
         self.job_tree.heading("#0", text="")
         self.job_tree.column("#0", width=30)
@@ -210,6 +312,8 @@ class ETLSchedulerApp:
         
     def create_job(self):
         """Open dialog to create new job"""
+        from job_dialog import JobDialog
+        
         dialog = JobDialog(self.root, self.job_manager)
         self.root.wait_window(dialog.dialog)
         
@@ -219,139 +323,273 @@ class ETLSchedulerApp:
             
     def edit_job(self):
         """Edit selected job"""
-        selection = self.job_tree.selection()
-        if not selection:
+        job = self._selected_job
+        if job is None:
             messagebox.showwarning("No Selection", "Please select a job to edit")
             return
             
-        job_id = int(selection[0])
-        job = self.job_manager.get_job(job_id)
+        from job_dialog import JobDialog
         
-        if job:
-            dialog = JobDialog(self.root, self.job_manager, job)
-            self.root.wait_window(dialog.dialog)
+        dialog = JobDialog(self.root, self.job_manager, job)
+        self.root.wait_window(dialog.dialog)
+        
+        if dialog.result:
+            self.refresh_job_list()
+            self.set_status(f"Job '{dialog.result['name']}' updated successfully")
             
-            if dialog.result:
-                self.refresh_job_list()
-                self.set_status(f"Job '{dialog.result['name']}' updated successfully")
-                
     def delete_job(self):
         """Delete selected job"""
-        selection = self.job_tree.selection()
-        if not selection:
+        job = self._selected_job
+        if job is None:
             messagebox.showwarning("No Selection", "Please select a job to delete")
             return
             
-        job_id = int(selection[0])
-        job = self.job_manager.get_job(job_id)
+        job_id = job['id']
         
-        if job and messagebox.askyesno("Confirm Delete", 
-                                       f"Are you sure you want to delete job '{job['name']}'?\n\nThis will also delete all execution history."):
+        if messagebox.askyesno("Confirm Delete", 
+                               f"Are you sure you want to delete job '{job['name']}'?\n\nThis will also delete all execution history."):
             self.job_manager.delete_job(job_id)
             self.refresh_job_list()
             self.set_status(f"Job '{job['name']}' deleted")
             
     def run_job_now(self):
         """Run selected job immediately"""
-        selection = self.job_tree.selection()
-        if not selection:
+        job = self._selected_job
+        if job is None:
             messagebox.showwarning("No Selection", "Please select a job to run")
             return
             
-        job_id = int(selection[0])
-        job = self.job_manager.get_job(job_id)
+        job_id = job['id']
+        
+        self.set_status(f"Running job '{job['name']}'...")
+        upstream = self._transitive.get(job_id)
+        future = self._exec_pool.submit(self.scheduler_engine.execute_job, job_id,
+                                        upstream=upstream)
+        future.add_done_callback(lambda f: self.post_status(('job_done', job_id)))
         
-        if job:
-            self.set_status(f"Running job '{job['name']}'...")
-            threading.Thread(target=self.scheduler_engine.execute_job, args=(job_id,), daemon=True).start()
-            
     def enable_job(self):
         """Enable selected job"""
-        selection = self.job_tree.selection()
-        if not selection:
+        if self._selected_job_id is None:
             return
             
-        job_id = int(selection[0])
-        self.job_manager.update_job_status(job_id, "enabled", True)
-        self.refresh_job_list()
+        self._write_queue.append((self._selected_job_id, "enabled", True))
+        self._schedule_flush()
         
     def disable_job(self):
         """Disable selected job"""
-        selection = self.job_tree.selection()
-        if not selection:
+        if self._selected_job_id is None:
             return
             
-        job_id = int(selection[0])
-        self.job_manager.update_job_status(job_id, "enabled", False)
+        self._write_queue.append((self._selected_job_id, "enabled", False))
+        self._schedule_flush()
+        
+    def _schedule_flush(self):
+        """Flush queued writes shortly, batching clicks that arrive together"""
+        if not self._write_pending:
+            self._write_pending = True
+            self.root.after(50, self._flush_writes)
+            
+    def _flush_writes(self):
+        """Write all queued updates at once and refresh the list once"""
+        self._write_pending = False
+        if not self._write_queue:
+            return
+            
+        updates, self._write_queue = self._write_queue, []
+        self.job_manager.update_statuses_bulk(updates)
         self.refresh_job_list()
         
+    def build_job_row(self, job):
+        """Build the (icon, values, sort keys) for a job list row"""
+        status_icon = _STATUS_ICON[bool(job['enabled'])]
+        
+        # Format schedule
+        schedule = job.get('schedule_type', 'Manual')
+        fmt, field = _SCHEDULE_FMTS.get(schedule, (None, None))
+        if fmt and job.get(field):
+            schedule = fmt.format_map(job)
+            
+        # Format dates
+        last_run_dt, last_run = _fmt_ts(job.get('last_run') or 'Never')
+        next_run_dt, next_run = _fmt_ts(job.get('next_run') or '-')
+        
+        values = (
+            job['name'],
+            job['job_type'],
+            schedule,
+            job['status'],
+            last_run,
+            next_run
+        )
+        
+        sort_keys = (
+            job['name'].lower(),
+            job['job_type'],
+            schedule.lower(),
+            job['status'],
+            last_run_dt,
+            next_run_dt
+        )
+        
+        return status_icon, values, sort_keys
+        
     def refresh_job_list(self):
         """Refresh job list display"""
-        # Clear current items
-        for item in self.job_tree.get_children():
-            self.job_tree.delete(item)
-            
         # Get all jobs
         jobs = self.job_manager.get_all_jobs()
         
-        # Add jobs to tree
-        for job in jobs:
-            status_icon = "✅" if job['enabled'] else "⏸️"
+        # Only touch rows that were added, changed or removed since the last refresh
+        stale = set(self._job_row_cache)
+        search_index = []
+        row_data = {}
+        selected_job = None
+        
+        for index, job in enumerate(jobs):
+            if job['id'] == self._selected_job_id:
+                selected_job = job
+                
+            status_icon, values, sort_keys = self.build_job_row(job)
+            
+            iid = str(job['id'])
+            row = (status_icon, values)
+            cached = self._job_row_cache.get(iid)
             
-            # Format schedule
-            schedule = job.get('schedule_type', 'Manual')
-            if schedule == 'cron' and job.get('cron_expression'):
-                schedule = f"Cron: {job['cron_expression']}"
-            elif schedule == 'interval' and job.get('interval_minutes'):
-                schedule = f"Every {job['interval_minutes']}m"
+            if cached is None:
+                self.job_tree.insert("", index, iid=iid, text=status_icon, values=values)
+            elif cached != row:
+                self.job_tree.item(iid, text=status_icon, values=values)
                 
-            # Format dates
-            last_run = job.get('last_run', 'Never')
-            if last_run and last_run != 'Never':
-                try:
-                    last_run = datetime.fromisoformat(last_run).strftime('%Y-%m-%d %H:%M')
-                except:
-                    pass
-                    
-            next_run = job.get('next_run', '-')
-            if next_run and next_run != '-':
-                try:
-                    next_run = datetime.fromisoformat(next_run).strftime('%Y-%m-%d %H:%M')
-                except:
-                    pass
+            self._job_row_cache[iid] = row
+            stale.discard(iid)
+            search_index.append((iid, ' '.join(map(str, values)).lower()))
+            row_data[iid] = sort_keys
             
-            values = (
-                job['name'],
-                job['job_type'],
-                schedule,
-                job['status'],
-                last_run,
-                next_run
-            )
+        # Remove rows for jobs that no longer exist
+        for iid in stale:
+            self.job_tree.delete(iid)
+            del self._job_row_cache[iid]
             
-            self.job_tree.insert("", tk.END, iid=str(job['id']), text=status_icon, values=values)
+        self._search_index = search_index
+        self._row_data = row_data
+        
+        # Re-resolve the cached selection; it goes away if the job was deleted
+        self._selected_job = selected_job
+        if selected_job is None:
+            self._selected_job_id = None
+        
+        self.rebuild_dependency_index([job['id'] for job in jobs])
+        
+        # Keep the current sort and search filter applied to new rows
+        self.apply_sort()
+        if self.search_var.get():
+            self.filter_jobs()
+        elif self._sort is not None:
+            self.job_tree.set_children('', *[item for item, _ in self._search_index])
             
         self.set_status(f"Loaded {len(jobs)} jobs")
         
+    def rebuild_dependency_index(self, job_ids):
+        """Precompute dependency closure and downstream counts for the scheduler"""
+        dep_graph = {job_id: set() for job_id in job_ids}
+        dependents = {job_id: [] for job_id in job_ids}
+        
+        for job_id, depends_on in self.job_manager.get_all_dependency_edges():
+            if job_id in dep_graph and depends_on in dep_graph:
+                dep_graph[job_id].add(depends_on)
+                dependents[depends_on].append(job_id)
+                
+        # Kahn's algorithm: a job's closure is final once all of its upstream jobs are
+        in_degree = {job_id: len(deps) for job_id, deps in dep_graph.items()}
+        ready = [job_id for job_id, count in in_degree.items() if count == 0]
+        transitive = {job_id: set(deps) for job_id, deps in dep_graph.items()}
+        
+        while ready:
+            job_id = ready.pop()
+            for dependent in dependents[job_id]:
+                transitive[dependent] |= transitive[job_id]
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+                    
+        downstream_count = dict.fromkeys(dep_graph, 0)
+        for upstream in transitive.values():
+            for job_id in upstream:
+                downstream_count[job_id] += 1
+                
+        self._dep_graph = dep_graph
+        self._transitive = transitive
+        self.scheduler_engine.set_dep_index(dep_graph, transitive, downstream_count)
+        
+    def refresh_job_row(self, job_id):
+        """Refresh a single job's row, falling back to a full refresh for new or deleted jobs"""
+        iid = str(job_id)
+        job = self.job_manager.get_job(job_id)
+        if job is None or iid not in self._job_row_cache:
+            self.refresh_job_list()
+            return
+            
+        if job_id == self._selected_job_id:
+            self._selected_job = job
+            
+        status_icon, values, sort_keys = self.build_job_row(job)
+        row = (status_icon, values)
+        if self._job_row_cache[iid] != row:
+            self.job_tree.item(iid, text=status_icon, values=values)
+            self._job_row_cache[iid] = row
+            
+        self._row_data[iid] = sort_keys
+        text = old_text = ' '.join(map(str, values)).lower()
+        for index, (item, item_text) in enumerate(self._search_index):
+            if item == iid:
+                old_text = item_text
+                self._search_index[index] = (iid, text)
+                break
+                
+        # Show or hide the row if the change moved it across the active filter
+        search_text = self.search_var.get().lower()
+        if search_text and (search_text in text) != (search_text in old_text):
+            self.filter_jobs()
+                
+    def schedule_filter(self):
+        """Debounce search typing so the filter runs once per pause"""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(120, self.filter_jobs)
+        
     def filter_jobs(self):
         """Filter jobs based on search text"""
+        self._filter_after_id = None
         search_text = self.search_var.get().lower()
         
-        for item in self.job_tree.get_children():
-            values = self.job_tree.item(item, 'values')
-            if search_text in ' '.join(str(v).lower() for v in values):
-                self.job_tree.reattach(item, '', tk.END)
-            else:
-                self.job_tree.detach(item)
-                
+        # Replace the shown rows in one call; rows left out are detached
+        self.job_tree.set_children('', *[item for item, text in self._search_index if search_text in text])
+        
     def sort_jobs(self, column):
         """Sort jobs by column"""
-        items = [(self.job_tree.set(item, column), item) for item in self.job_tree.get_children('')]
-        items.sort()
+        col_index = ("Name", "Type", "Schedule", "Status", "Last Run", "Next Run").index(column)
+        reverse = self._sort_reverse.get(column, False)
+        self._sort_reverse[column] = not reverse
+        self._sort = (col_index, reverse)
+        self.apply_sort()
+        
+        # Reorder only the rows currently shown, leaving filtered-out rows detached
+        visible = set(self.job_tree.get_children(''))
+        self.job_tree.set_children('', *[item for item, _ in self._search_index if item in visible])
+        
+    def apply_sort(self):
+        """Order the search index by the last column sort, so the filter walks rows in that order"""
+        if self._sort is None:
+            return
+        col_index, reverse = self._sort
+        row_data = self._row_data
         
-        for index, (val, item) in enumerate(items):
-            self.job_tree.move(item, '', index)
+        # Sort on the typed values; rows without a date always sort last
+        def sort_key(entry):
+            value = row_data[entry[0]][col_index]
+            return (value is None) != reverse, value if value is not None else 0
             
+        self._search_index.sort(key=sort_key, reverse=reverse)
+        
     def on_job_select(self, event):
         """Handle job selection"""
         selection = self.job_tree.selection()
@@ -361,6 +599,10 @@ class ETLSchedulerApp:
         job_id = int(selection[0])
         job = self.job_manager.get_job(job_id)
         
+        # Cache the selection so the toolbar and menu actions skip the lookups
+        self._selected_job = job
+        self._selected_job_id = job_id if job else None
+        
         if job:
             # Update details
             self.update_job_details(job)
@@ -373,85 +615,95 @@ class ETLSchedulerApp:
             
     def update_job_details(self, job):
         """Update job details display"""
-        self.details_text.config(state=tk.NORMAL)
-        self.details_text.delete(1.0, tk.END)
-        
-        details = f"""Job Information
-{'=' * 80}
+        buf = io.StringIO()
+        buf.write(f"""Job Information
+{_SEP}
 
 Name: {job['name']}
 Type: {job['job_type']}
 Status: {job['status']}
-Enabled: {'Yes' if job['enabled'] else 'No'}
+Enabled: {_YESNO[bool(job['enabled'])]}
 
 Schedule
-{'=' * 80}
+{_SEP}
 Type: {job.get('schedule_type', 'Manual')}
-"""
+""")
         
         if job.get('cron_expression'):
-            details += f"Cron Expression: {job['cron_expression']}\n"
+            buf.write(f"Cron Expression: {job['cron_expression']}\n")
         if job.get('interval_minutes'):
-            details += f"Interval: {job['interval_minutes']} minutes\n"
+            buf.write(f"Interval: {job['interval_minutes']} minutes\n")
             
-        details += f"\nCommand/Script\n{'=' * 80}\n"
-        details += job.get('command', 'N/A') + "\n"
+        buf.write(_header('Command/Script'))
+        buf.write(job.get('command', 'N/A') + "\n")
         
         if job.get('working_directory'):
-            details += f"\nWorking Directory\n{'=' * 80}\n{job['working_directory']}\n"
+            buf.write(_header('Working Directory'))
+            buf.write(f"{job['working_directory']}\n")
             
         if job.get('environment_vars'):
-            details += f"\nEnvironment Variables\n{'=' * 80}\n"
+            buf.write(_header('Environment Variables'))
             try:
-                env_vars = json.loads(job['environment_vars'])
-                for key, value in env_vars.items():
-                    details += f"{key} = {value}\n"
-            except:
-                details += job['environment_vars'] + "\n"
+                env_vars = _json_loads(job['environment_vars'])
+                buf.writelines(f"{key} = {value}\n" for key, value in env_vars.items())
+            except (ValueError, AttributeError):
+                buf.write(job['environment_vars'] + "\n")
                 
-        details += f"\nRetry Configuration\n{'=' * 80}\n"
-        details += f"Max Retries: {job.get('max_retries', 0)}\n"
-        details += f"Retry Delay: {job.get('retry_delay_seconds', 60)} seconds\n"
+        buf.write(_header('Retry Configuration'))
+        buf.write(f"Max Retries: {job.get('max_retries', 0)}\n")
+        buf.write(f"Retry Delay: {job.get('retry_delay_seconds', 60)} seconds\n")
         
         if job.get('timeout_seconds'):
-            details += f"\nTimeout\n{'=' * 80}\n{job['timeout_seconds']} seconds\n"
+            buf.write(_header('Timeout'))
+            buf.write(f"{job['timeout_seconds']} seconds\n")
             
         if job.get('notification_email'):
-            details += f"\nNotifications\n{'=' * 80}\n"
-            details += f"Email: {job['notification_email']}\n"
-            details += f"On Success: {'Yes' if job.get('notify_on_success') else 'No'}\n"
-            details += f"On Failure: {'Yes' if job.get('notify_on_failure') else 'No'}\n"
+            buf.write(_header('Notifications'))
+            buf.write(f"Email: {job['notification_email']}\n")
+            buf.write(f"On Success: {_YESNO[bool(job.get('notify_on_success'))]}\n")
+            buf.write(f"On Failure: {_YESNO[bool(job.get('notify_on_failure'))]}\n")
             
         if job.get('description'):
-            details += f"\nDescription\n{'=' * 80}\n{job['description']}\n"
+            buf.write(_header('Description'))
+            buf.write(f"{job['description']}\n")
             
-        self.details_text.insert(1.0, details)
+        self.details_text.config(state=tk.NORMAL)
+        self.details_text.delete(1.0, tk.END)
+        self.details_text.insert(1.0, buf.getvalue())
         self.details_text.config(state=tk.DISABLED)
         
     def update_recent_executions(self, job_id):
+        """Fetch recent executions in the background and post them to the status queue"""
+        future = self._executor.submit(self.job_manager.get_job_executions, job_id, 50)
+        
+        def on_done(f):
+            if f.exception() is None:
+                self.post_status(('executions', job_id, f.result()))
+                
+        future.add_done_callback(on_done)
+        
+    def render_recent_executions(self, executions):
         """Update recent executions display"""
         # Clear current items
         for item in self.execution_tree.get_children():
             self.execution_tree.delete(item)
             
-        # Get recent executions
-        executions = self.job_manager.get_job_executions(job_id, limit=50)
+        # Bind the per-row lookups once for the loop
+        parse = _parse_timestamp
+        strftime = datetime.strftime
+        insert = self.execution_tree.insert
         
         for exec in executions:
-            start_time = datetime.fromisoformat(exec['start_time']).strftime('%Y-%m-%d %H:%M:%S')
+            start_dt = parse(exec['start_time'])
+            start_time = strftime(start_dt, '%Y-%m-%d %H:%M:%S')
             
             end_time = '-'
             duration = '-'
             if exec['end_time']:
-                end_time = datetime.fromisoformat(exec['end_time']).strftime('%Y-%m-%d %H:%M:%S')
-                try:
-                    start_dt = datetime.fromisoformat(exec['start_time'])
-                    end_dt = datetime.fromisoformat(exec['end_time'])
-                    duration_sec = (end_dt - start_dt).total_seconds()
-                    duration = f"{int(duration_sec)}s"
-                except:
-                    pass
-                    
+                end_dt = parse(exec['end_time'])
+                end_time = strftime(end_dt, '%Y-%m-%d %H:%M:%S')
+                duration = f"{int((end_dt - start_dt).total_seconds())}s"
+                
             values = (
                 exec['id'],
                 start_time,
@@ -461,43 +713,45 @@ Type: {job.get('schedule_type', 'Manual')}
                 exec.get('exit_code', '-')
             )
             
-            self.execution_tree.insert("", tk.END, values=values)
+            insert("", tk.END, values=values)
             
     def update_dependencies(self, job):
         """Update dependencies display"""
-        self.deps_text.config(state=tk.NORMAL)
-        self.deps_text.delete(1.0, tk.END)
-        
-        deps_info = f"""Job Dependencies
-{'=' * 80}
+        buf = io.StringIO()
+        buf.write(f"""Job Dependencies
+{_SEP}
 
-"""
+""")
         
         # Get dependencies
         dependencies = self.job_manager.get_job_dependencies(job['id'])
         
         if dependencies:
-            deps_info += "This job depends on:\n\n"
+            buf.write("This job depends on:\n\n")
+            dep_jobs = self.job_manager.get_jobs_by_ids(d['depends_on_job_id'] for d in dependencies)
             for dep in dependencies:
-                dep_job = self.job_manager.get_job(dep['depends_on_job_id'])
+                dep_job = dep_jobs.get(dep['depends_on_job_id'])
                 if dep_job:
-                    deps_info += f"  → {dep_job['name']} (ID: {dep_job['id']})\n"
+                    buf.write(f"  → {dep_job['name']} (ID: {dep_job['id']})\n")
         else:
-            deps_info += "This job has no dependencies.\n"
+            buf.write("This job has no dependencies.\n")
             
-        deps_info += f"\n\nDependent Jobs\n{'=' * 80}\n\n"
+        buf.write("\n")
+        buf.write(_header('Dependent Jobs'))
+        buf.write("\n")
         
         # Get jobs that depend on this job
         dependent_jobs = self.job_manager.get_dependent_jobs(job['id'])
         
         if dependent_jobs:
-            deps_info += "The following jobs depend on this job:\n\n"
-            for dep_job in dependent_jobs:
-                deps_info += f"  ← {dep_job['name']} (ID: {dep_job['id']})\n"
+            buf.write("The following jobs depend on this job:\n\n")
+            buf.writelines(f"  ← {dep_job['name']} (ID: {dep_job['id']})\n" for dep_job in dependent_jobs)
         else:
-            deps_info += "No jobs depend on this job.\n"
+            buf.write("No jobs depend on this job.\n")
             
-        self.deps_text.insert(1.0, deps_info)
+        self.deps_text.config(state=tk.NORMAL)
+        self.deps_text.delete(1.0, tk.END)
+        self.deps_text.insert(1.0, buf.getvalue())
         self.deps_text.config(state=tk.DISABLED)
         
     def view_execution_log(self):
@@ -510,6 +764,7 @@ Type: {job.get('schedule_type', 'Manual')}
         execution = self.job_manager.get_execution(exec_id)
         
         if execution:
+            from log_viewer import LogViewer
             LogViewer(self.root, execution)
             
     def show_workflow_designer(self):
@@ -518,7 +773,11 @@ Type: {job.get('schedule_type', 'Manual')}
         workflow_window.title("Workflow Designer")
         workflow_window.geometry("1200x800")
         
-        WorkflowCanvas(workflow_window, self.job_manager)
+        from workflow_canvas import WorkflowCanvas
+        workflow = WorkflowCanvas(workflow_window, self.job_manager)
+        self._workflow_canvases.append(workflow)
+        workflow_window.bind("<Destroy>", lambda e: e.widget is workflow_window and
+                             self._workflow_canvases.remove(workflow))
         
     def show_execution_logs(self):
         """Show execution logs window"""
@@ -535,6 +794,7 @@ Type: {job.get('schedule_type', 'Manual')}
         
     def show_settings(self):
         """Show settings dialog"""
+        from settings_dialog import SettingsDialog
         SettingsDialog(self.root, self.scheduler_engine)
         
     def show_documentation(self):
@@ -597,22 +857,30 @@ KEYBOARD SHORTCUTS
         )
         
         if filename:
-            try:
-                with open(filename, 'r') as f:
-                    jobs_data = json.load(f)
-                    
-                count = 0
-                for job_data in jobs_data:
-                    # Remove id to create new jobs
-                    job_data.pop('id', None)
-                    self.job_manager.create_job(job_data)
-                    count += 1
-                    
-                self.refresh_job_list()
-                messagebox.showinfo("Import Complete", f"Successfully imported {count} jobs")
-            except Exception as e:
-                messagebox.showerror("Import Error", f"Failed to import jobs:\n{str(e)}")
-                
+            # The import runs on a worker thread while it holds the database write lock,
+            # so progress goes through the status queue instead of re-entering Tk
+            def run_import():
+                with open(filename, 'rb') as f:
+                    # Stream one job at a time when ijson is available; use_float keeps
+                    # fractional numbers bindable by sqlite3 instead of Decimal
+                    jobs_data = ijson.items(f, 'item', use_float=True) if ijson else _json_loads(f.read())
+                    return self.job_manager.create_jobs_bulk(
+                        jobs_data, progress_callback=lambda count: self.post_status(('import_progress', count)))
+                        
+            self.set_status("Importing jobs...")
+            future = self._executor.submit(run_import)
+            future.add_done_callback(lambda f: self.post_status(('import_done', f)))
+            
+    def finish_import(self, future):
+        """Report a finished background import"""
+        error = future.exception()
+        if error is not None:
+            messagebox.showerror("Import Error", f"Failed to import jobs:\n{str(error)}")
+            return
+            
+        self.refresh_job_list()
+        messagebox.showinfo("Import Complete", f"Successfully imported {future.result()} jobs")
+        
     def export_jobs(self):
         """Export jobs to JSON file"""
         filename = filedialog.asksaveasfilename(
@@ -623,49 +891,104 @@ KEYBOARD SHORTCUTS
         
         if filename:
             try:
-                jobs = self.job_manager.get_all_jobs()
+                # Write one job per line so only a single row is held in memory
+                count = 0
                 with open(filename, 'w') as f:
-                    json.dump(jobs, f, indent=2)
+                    f.write('[')
+                    for job in self.job_manager.iter_all_jobs():
+                        row = orjson.dumps(job, default=str).decode() if orjson else json.dumps(job, default=str)
+                        f.write((',\n  ' if count else '\n  ') + row)
+                        count += 1
+                    f.write('\n]\n' if count else ']\n')
                     
-                messagebox.showinfo("Export Complete", f"Successfully exported {len(jobs)} jobs")
+                messagebox.showinfo("Export Complete", f"Successfully exported {count} jobs")
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export jobs:\n{str(e)}")
                 
     def update_job_status(self, job_id, status, output=None):
         """Thread-safe job status update"""
-        self.status_queue.put(('job_status', job_id, status, output))
+        self.post_status(('job_status', job_id, status, output))
+        
+    def post_status(self, item):
+        """Queue an update from a worker thread for the next drain on the UI thread"""
+        # Workers never call into Tk, so they don't wait on its lock
+        self.status_queue.put(item)
         
     def check_status_updates(self):
-        """Check for status updates from worker threads"""
+        """Apply queued status updates, then poll again after STATUS_POLL_MS"""
         try:
-            while True:
-                item = self.status_queue.get_nowait()
+            self.drain_status_queue()
+        finally:
+            self.root.after(self.STATUS_POLL_MS, self.check_status_updates)
+            
+    def drain_status_queue(self):
+        """Apply queued status updates from worker threads"""
+        # Drain everything queued so far, then fold it in one pass
+        items = []
+        get_nowait = self.status_queue.get_nowait
+        while True:
+            try:
+                items.append(get_nowait())
+            except queue.Empty:
+                break
                 
-                if item[0] == 'job_status':
-                    _, job_id, status, output = item
-                    
-                    # Update UI if this job is selected
-                    selection = self.job_tree.selection()
-                    if selection and int(selection[0]) == job_id:
-                        # Refresh executions
-                        self.update_recent_executions(job_id)
+        # Keep only the latest update per job
+        pending = {}
+        executions = {}
+        imports = []
+        for item in items:
+            kind = item[0]
+            if kind == 'job_status':
+                _, job_id, status, output = item
+                pending[job_id] = (status, output)
+            elif kind == 'job_done':
+                # Don't overwrite a status update that carries output
+                pending.setdefault(item[1], (None, None))
+            elif kind == 'executions':
+                _, job_id, rows = item
+                executions[job_id] = rows
+            elif kind == 'import_progress':
+                self.set_status(f"Importing jobs... {item[1]} so far")
+            elif kind == 'import_done':
+                imports.append(item[1])
+                
+        if pending:
+            # Only the rows of jobs that changed need refreshing
+            refresh_job_row = self.refresh_job_row
+            for job_id in pending:
+                refresh_job_row(job_id)
+                
+            # Recolor the job's box in open designers rather than redrawing them
+            for workflow in self._workflow_canvases:
+                for job_id, (status, _) in pending.items():
+                    if status:
+                        workflow.update_job_status(job_id, status)
                         
-                        # Update output log
-                        if output:
-                            self.log_text.config(state=tk.NORMAL)
-                            self.log_text.delete(1.0, tk.END)
-                            self.log_text.insert(1.0, output)
-                            self.log_text.config(state=tk.DISABLED)
-                            
-                    # Refresh job list to update status
-                    self.refresh_job_list()
+            # Update UI if the selected job changed
+            job_id = self._selected_job_id
+            if job_id in pending:
+                _, output = pending[job_id]
+                
+                # Refresh executions
+                self.update_recent_executions(job_id)
+                
+                # Update output log
+                if output:
+                    log = self.log_text
+                    log.config(state=tk.NORMAL)
+                    log.delete(1.0, tk.END)
+                    log.insert(1.0, output)
+                    log.config(state=tk.DISABLED)
                     
-        except queue.Empty:
-            pass
-        finally:
-            # Schedule next check
-            self.root.after(500, self.check_status_updates)
-            
+        # Show fetched executions if their job is still selected
+        if executions:
+            if self._selected_job_id in executions:
+                self.render_recent_executions(executions[self._selected_job_id])
+                
+        # Last, as the result dialogs wait for the user
+        for future in imports:
+            self.finish_import(future)
+                
     def set_status(self, message):
         """Update status bar"""
         self.status_bar.config(text=f"{message}  |  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -673,7 +996,11 @@ KEYBOARD SHORTCUTS
     def on_closing(self):
         """Handle application closing"""
         if messagebox.askokcancel("Quit", "Do you want to quit? Running jobs will be terminated."):
+            self._flush_writes()
             self.scheduler_engine.stop()
+            self._executor.shutdown(wait=False)
+            self._exec_pool.shutdown(wait=False, cancel_futures=True)
+            self.job_manager.close()
             self.root.destroy()
 
 
@@ -3,25 +3,119 @@ Job Dialog - Dialog for creating and editing jobs
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-import json
+from tkinter import ttk, messagebox
+import re
+from datetime import datetime
+
+# JSON module, imported on first validate() since most dialogs are opened and closed without saving
+_json = None
+
+try:
+    from croniter import croniter
+except ImportError:
+    croniter = None
+
+# Cheap shape check for cron expressions: five (or six, with seconds) fields, or an @macro
+_CRON_RE = re.compile(r'^\s*(@\w+|(\S+\s+){4,5}\S+)\s*$')
+
+# Fixed text and fonts shared by every dialog instance
+_CRON_EXAMPLES = (
+    "0 9 * * * - Daily at 9:00 AM",
+    "0 */6 * * * - Every 6 hours",
+    "0 0 * * 1 - Every Monday at midnight",
+    "*/15 * * * * - Every 15 minutes",
+)
+_FONT_SMALL = ("Arial", 8)
+_FONT_BOLD = ("Arial", 9, "bold")
+_FONT_HEADING = ("Arial", 10, "bold")
+
+# Dependency rows kept in the Treeview at once; the window slides as the list scrolls
+_DEPS_WINDOW = 200
+
+
+def _json_loads(text):
+    """Parse JSON with orjson when installed, importing the parser on first use"""
+    global _json
+    if _json is None:
+        try:
+            import orjson as _json
+        except ImportError:
+            import json as _json
+    return _json.loads(text)
+
+
+def _is_int_text(text):
+    """Key validator for numeric entries: accept only an empty field or digits"""
+    return text == '' or text.isdigit()
+
+
+def _try_int(text):
+    """Parse a non-negative integer field; empty text gives None, anything else raises ValueError"""
+    text = text.strip()
+    if not text:
+        return None
+    value = int(text)
+    if value < 0:
+        raise ValueError(f"negative value: {text}")
+    return value
 
 
 class JobDialog:
     """Dialog for creating/editing jobs"""
     
+    # Simple form rows built by _build_rows:
+    # (grid row, label, variable attribute, default, widget kind, width, sticky)
+    _BASIC_ROWS = (
+        (0, "Job Name:", 'name_var', "", 'entry', 50, tk.EW),
+    )
+    _EXECUTION_ROWS = (
+        (3, "Timeout (seconds):", 'timeout_var', "", 'int', 20, tk.W),
+        (4, "Max Retries:", 'max_retries_var', "0", 'spinbox', 20, tk.W),
+        (5, "Retry Delay (seconds):", 'retry_delay_var', "60", 'int', 20, tk.W),
+    )
+    _NOTIFICATION_ROWS = (
+        (0, "Notification Email:", 'notification_email_var', "", 'entry', 40, tk.EW),
+    )
+    
+    # Form variables filled by load_job_data: (variable attribute, job key, default)
+    _LOAD_MAP = (
+        ('name_var', 'name', ''),
+        ('job_type_var', 'job_type', 'python'),
+        ('enabled_var', 'enabled', True),
+        ('working_dir_var', 'working_directory', ''),
+        ('timeout_var', 'timeout_seconds', ''),
+        ('max_retries_var', 'max_retries', 0),
+        ('retry_delay_var', 'retry_delay_seconds', 60),
+        ('schedule_type_var', 'schedule_type', 'manual'),
+        ('interval_var', 'interval_minutes', 60),
+        ('cron_var', 'cron_expression', ''),
+        ('notification_email_var', 'notification_email', ''),
+        ('notify_success_var', 'notify_on_success', False),
+        ('notify_failure_var', 'notify_on_failure', True),
+    )
+    
     def __init__(self, parent, job_manager, job=None):
         self.parent = parent
         self.job_manager = job_manager
         self.job = job
         self.result = None
         
+        # Text fields, environment variables and numeric fields read by validate(), reused by save()
+        self._form = {}
+        self._parsed_env = None
+        self._ints = {}
+        self._next_run = None
+        
         # Create dialog
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Edit Job" if job else "New Job")
         self.dialog.geometry("700x800")
-        self.dialog.transient(parent)
-        self.dialog.grab_set()
+        
+        # Keep the window unmapped while the tabs are built so it is laid out once
+        self.dialog.withdraw()
+        
+        # Numeric entries reject non-digit keystrokes as they are typed
+        self._int_vcmd = (self.dialog.register(_is_int_text), '%P')
         
         self.setup_ui()
         
@@ -29,6 +123,15 @@ class JobDialog:
         if job:
             self.load_job_data()
             
+        # Track edits from here on so an unchanged job can be closed without writing
+        self._dirty = False
+        self.watch_changes()
+        
+        # Show the finished dialog as a modal child of the main window
+        self.dialog.transient(parent)
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+            
     def setup_ui(self):
         """Setup dialog UI"""
         # Create notebook for tabs
@@ -50,10 +153,11 @@ class JobDialog:
         notebook.add(schedule_frame, text="Schedule")
         self.setup_schedule_tab(schedule_frame)
         
-        # Dependencies Tab
-        deps_frame = ttk.Frame(notebook)
-        notebook.add(deps_frame, text="Dependencies")
-        self.setup_dependencies_tab(deps_frame)
+        # Dependencies Tab, built the first time it is shown since it queries every job
+        self._deps_frame = ttk.Frame(notebook)
+        self._deps_built = False
+        notebook.add(self._deps_frame, text="Dependencies")
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Notifications Tab
         notif_frame = ttk.Frame(notebook)
@@ -76,9 +180,7 @@ class JobDialog:
         container.pack(fill=tk.BOTH, expand=True)
         
         # Name
-        ttk.Label(container, text="Job Name:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.name_var = tk.StringVar()
-        ttk.Entry(container, textvariable=self.name_var, width=50).grid(row=0, column=1, pady=5, sticky=tk.EW)
+        self._build_rows(container, self._BASIC_ROWS)
         
         # Description
         ttk.Label(container, text="Description:").grid(row=1, column=0, sticky=tk.NW, pady=5)
@@ -127,25 +229,13 @@ class JobDialog:
         
         # Environment Variables
         ttk.Label(container, text="Environment Variables:").grid(row=1, column=0, sticky=tk.NW, pady=5)
-        ttk.Label(container, text="(JSON format)", font=("Arial", 8)).grid(row=2, column=0, sticky=tk.W)
+        ttk.Label(container, text="(JSON format)", font=_FONT_SMALL).grid(row=2, column=0, sticky=tk.W)
         self.env_vars_text = tk.Text(container, height=4, width=50)
         self.env_vars_text.grid(row=1, column=1, rowspan=2, pady=5, sticky=tk.EW)
         self.env_vars_text.insert(1.0, '{\n  "KEY": "value"\n}')
         
-        # Timeout
-        ttk.Label(container, text="Timeout (seconds):").grid(row=3, column=0, sticky=tk.W, pady=5)
-        self.timeout_var = tk.StringVar()
-        ttk.Entry(container, textvariable=self.timeout_var, width=20).grid(row=3, column=1, sticky=tk.W, pady=5)
-        
-        # Retry Configuration
-        ttk.Label(container, text="Max Retries:").grid(row=4, column=0, sticky=tk.W, pady=5)
-        self.max_retries_var = tk.StringVar(value="0")
-        ttk.Spinbox(container, from_=0, to=10, textvariable=self.max_retries_var, width=20).grid(
-            row=4, column=1, sticky=tk.W, pady=5)
-        
-        ttk.Label(container, text="Retry Delay (seconds):").grid(row=5, column=0, sticky=tk.W, pady=5)
-        self.retry_delay_var = tk.StringVar(value="60")
-        ttk.Entry(container, textvariable=self.retry_delay_var, width=20).grid(row=5, column=1, sticky=tk.W, pady=5)
+        # Timeout and Retry Configuration
+        self._build_rows(container, self._EXECUTION_ROWS)
         
         container.columnconfigure(1, weight=1)
         
@@ -174,7 +264,8 @@ class JobDialog:
         
         ttk.Label(self.interval_frame, text="Run every:").pack(side=tk.LEFT, padx=5)
         self.interval_var = tk.StringVar(value="60")
-        ttk.Entry(self.interval_frame, textvariable=self.interval_var, width=10).pack(side=tk.LEFT)
+        ttk.Entry(self.interval_frame, textvariable=self.interval_var, width=10,
+                  validate='key', validatecommand=self._int_vcmd).pack(side=tk.LEFT)
         ttk.Label(self.interval_frame, text="minutes").pack(side=tk.LEFT, padx=5)
         
         # Cron configuration
@@ -185,15 +276,9 @@ class JobDialog:
         self.cron_var = tk.StringVar()
         ttk.Entry(self.cron_frame, textvariable=self.cron_var, width=40).pack(fill=tk.X, pady=5)
         
-        ttk.Label(self.cron_frame, text="Examples:", font=("Arial", 9, "bold")).pack(anchor=tk.W, pady=(10, 5))
-        examples = [
-            "0 9 * * * - Daily at 9:00 AM",
-            "0 */6 * * * - Every 6 hours",
-            "0 0 * * 1 - Every Monday at midnight",
-            "*/15 * * * * - Every 15 minutes"
-        ]
-        for example in examples:
-            ttk.Label(self.cron_frame, text=example, font=("Arial", 8)).pack(anchor=tk.W, padx=10)
+        ttk.Label(self.cron_frame, text="Examples:", font=_FONT_BOLD).pack(anchor=tk.W, pady=(10, 5))
+        for example in _CRON_EXAMPLES:
+            ttk.Label(self.cron_frame, text=example, font=_FONT_SMALL).pack(anchor=tk.W, padx=10)
         
         self.update_schedule_ui()
         container.columnconfigure(1, weight=1)
@@ -203,7 +288,7 @@ class JobDialog:
         container = ttk.Frame(parent, padding=10)
         container.pack(fill=tk.BOTH, expand=True)
         
-        ttk.Label(container, text="This job depends on:", font=("Arial", 10, "bold")).pack(anchor=tk.W, pady=5)
+        ttk.Label(container, text="This job depends on:", font=_FONT_HEADING).pack(anchor=tk.W, pady=5)
         
         # List of available jobs
         list_frame = ttk.Frame(container)
@@ -212,20 +297,36 @@ class JobDialog:
         scrollbar = ttk.Scrollbar(list_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.deps_listbox = tk.Listbox(list_frame, selectmode=tk.MULTIPLE, yscrollcommand=scrollbar.set)
+        # The Treeview only ever holds a window of rows; the scrollbar is mapped
+        # onto the whole list so huge job catalogs stay responsive
+        self._deps_scrollbar = scrollbar
+        self._rendered_range = (0, 0)
+        self.deps_listbox = ttk.Treeview(list_frame, columns=('name',), show='headings', 
+                                         selectmode='extended', yscrollcommand=self._on_deps_yscroll)
+        self.deps_listbox.heading('name', text='Job')
         self.deps_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.deps_listbox.yview)
+        scrollbar.config(command=self._on_deps_scrollbar)
         
-        # Load available jobs
-        jobs = self.job_manager.get_all_jobs()
-        self.available_jobs = {}
-        for job in jobs:
-            if not self.job or job['id'] != self.job['id']:  # Don't show self
-                self.available_jobs[job['id']] = job['name']
-                self.deps_listbox.insert(tk.END, job['name'])
+        # Clicking toggles a row, like the multiple-selection listbox did
+        self.deps_listbox.bind('<Button-1>', self.toggle_dependency)
+        # Keyboard selection bypasses the click binding, so mirror it too
+        self.deps_listbox.bind('<<TreeviewSelect>>', self._sync_selected_ids)
+        
+        # Load available jobs, keyed by job ID as the row iid, along with the
+        # current dependencies so load_job_data doesn't query them again
+        own_id = self.job['id'] if self.job else None
+        jobs, self._dep_ids = self.job_manager.get_jobs_with_deps_for(own_id)
+        
+        # Don't show self
+        self.available_jobs = {job['id']: job['name'] for job in jobs if job['id'] != own_id}
+        self._available_job_ids = list(self.available_jobs)
+        
+        # Selected dependency IDs, including rows outside the rendered window
+        self._selected_ids = set(self._dep_ids)
+        self._render_deps_window(0)
         
         ttk.Label(container, text="Select jobs that must complete successfully before this job runs", 
-                 font=("Arial", 8)).pack(anchor=tk.W, pady=5)
+                 font=_FONT_SMALL).pack(anchor=tk.W, pady=5)
         
     def setup_notifications_tab(self, parent):
         """Setup notifications tab"""
@@ -233,13 +334,10 @@ class JobDialog:
         container.pack(fill=tk.BOTH, expand=True)
         
         # Email
-        ttk.Label(container, text="Notification Email:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.notification_email_var = tk.StringVar()
-        ttk.Entry(container, textvariable=self.notification_email_var, width=40).grid(
-            row=0, column=1, sticky=tk.EW, pady=5)
+        self._build_rows(container, self._NOTIFICATION_ROWS)
         
         # Notification options
-        ttk.Label(container, text="Send notifications:", font=("Arial", 10, "bold")).grid(
+        ttk.Label(container, text="Send notifications:", font=_FONT_HEADING).grid(
             row=1, column=0, columnspan=2, sticky=tk.W, pady=(15, 5))
         
         self.notify_success_var = tk.BooleanVar(value=False)
@@ -251,11 +349,119 @@ class JobDialog:
             row=3, column=1, sticky=tk.W, pady=2)
         
         ttk.Label(container, text="Note: SMTP configuration required in settings", 
-                 font=("Arial", 8), foreground="gray").grid(
+                 font=_FONT_SMALL, foreground="gray").grid(
             row=4, column=0, columnspan=2, sticky=tk.W, pady=15)
         
         container.columnconfigure(1, weight=1)
         
+    def _on_tab_changed(self, event):
+        """Build the dependencies tab when it is first selected"""
+        if not self._deps_built and event.widget.select() == str(self._deps_frame):
+            self._deps_built = True
+            self.setup_dependencies_tab(self._deps_frame)
+            
+    def toggle_dependency(self, event):
+        """Toggle the clicked dependency row"""
+        iid = self.deps_listbox.identify_row(event.y)
+        if iid:
+            self.deps_listbox.selection_toggle(iid)
+            self._selected_ids ^= {int(iid)}
+        return "break"
+        
+    def _sync_selected_ids(self, event=None):
+        """Rebuild _selected_ids for the rendered window from the Treeview selection"""
+        lo, hi = self._rendered_range
+        window = set(self._available_job_ids[lo:hi])
+        shown = {int(iid) for iid in self.deps_listbox.selection()}
+        self._selected_ids = (self._selected_ids - window) | shown
+        
+    def _render_deps_window(self, lo):
+        """Insert only the rows in [lo, lo + _DEPS_WINDOW) and reapply their selection"""
+        ids = self._available_job_ids
+        lo = max(0, min(lo, len(ids) - _DEPS_WINDOW))
+        hi = min(len(ids), lo + _DEPS_WINDOW)
+        
+        tree = self.deps_listbox
+        tree.delete(*tree.get_children())
+        
+        insert = tree.insert
+        names = self.available_jobs
+        for job_id in ids[lo:hi]:
+            insert('', tk.END, iid=str(job_id), values=(names[job_id],))
+            
+        selected_ids = self._selected_ids
+        selected = [str(job_id) for job_id in ids[lo:hi] if job_id in selected_ids]
+        if selected:
+            tree.selection_add(selected)
+            
+        self._rendered_range = (lo, hi)
+        
+    def _scroll_deps_to(self, index):
+        """Re-center the rendered window on a row and scroll it to the top"""
+        self._render_deps_window(index - _DEPS_WINDOW // 2)
+        lo, hi = self._rendered_range
+        self.deps_listbox.yview_moveto((index - lo) / max(1, hi - lo))
+        
+    def _on_deps_scrollbar(self, *args):
+        """Scrollbar drags jump across the whole list; arrow and page steps scroll the window"""
+        if args[0] == 'moveto':
+            self._scroll_deps_to(int(float(args[1]) * len(self._available_job_ids)))
+        else:
+            self.deps_listbox.yview(*args)
+            
+    def _on_deps_yscroll(self, first, last):
+        """Report the window's position relative to the whole list and slide it near its edges"""
+        lo, hi = self._rendered_range
+        total = max(1, len(self._available_job_ids))
+        first, last = float(first), float(last)
+        span = hi - lo
+        
+        self._deps_scrollbar.set((lo + first * span) / total, (lo + last * span) / total)
+        
+        if (first < 0.1 and lo > 0) or (last > 0.9 and hi < total):
+            self._scroll_deps_to(int(lo + first * span))
+        
+    def watch_changes(self):
+        """Mark the form dirty whenever a field is edited"""
+        for var in (self.name_var, self.job_type_var, self.enabled_var, self.working_dir_var,
+                    self.timeout_var, self.max_retries_var, self.retry_delay_var,
+                    self.schedule_type_var, self.interval_var, self.cron_var,
+                    self.notification_email_var, self.notify_success_var, self.notify_failure_var):
+            var.trace_add('write', self._mark_dirty)
+            
+        for text in (self.description_text, self.command_text, self.env_vars_text):
+            text.edit_modified(False)
+            text.bind('<<Modified>>', self._mark_text_dirty)
+            
+    def _mark_dirty(self, *args):
+        """Record that the form has been edited"""
+        self._dirty = True
+        
+    def _mark_text_dirty(self, event):
+        """Record a text edit, ignoring the <<Modified>> events queued while loading the form"""
+        # Loading and the edit_modified(False) reset queue events that arrive after the bind;
+        # only a real edit leaves the widget's modified flag set
+        if event.widget.edit_modified():
+            self._dirty = True
+        
+    def _build_rows(self, container, rows):
+        """Create and grid the label + input pairs described by rows in one pass"""
+        label, entry, spinbox = ttk.Label, ttk.Entry, ttk.Spinbox
+        for row, text, attr, default, kind, width, sticky in rows:
+            var = tk.StringVar(value=default)
+            setattr(self, attr, var)
+            
+            label(container, text=text).grid(row=row, column=0, sticky=tk.W, pady=5)
+            if kind == 'spinbox':
+                widget = spinbox(container, from_=0, to=10, textvariable=var, width=width,
+                                 validate='key', validatecommand=self._int_vcmd)
+            elif kind == 'int':
+                widget = entry(container, textvariable=var, width=width,
+                               validate='key', validatecommand=self._int_vcmd)
+            else:
+                widget = entry(container, textvariable=var, width=width)
+            widget.grid(row=row, column=1, sticky=sticky, pady=5)
+            
     def update_schedule_ui(self):
         """Update schedule UI based on selected type"""
         schedule_type = self.schedule_type_var.get()
@@ -272,6 +478,8 @@ class JobDialog:
             
     def browse_script(self):
         """Browse for script file"""
+        from tkinter import filedialog
+        
         filename = filedialog.askopenfilename(
             title="Select Script",
             filetypes=[
@@ -287,128 +495,171 @@ class JobDialog:
             
     def browse_directory(self):
         """Browse for working directory"""
+        from tkinter import filedialog
+        
         dirname = filedialog.askdirectory(title="Select Working Directory")
         if dirname:
             self.working_dir_var.set(dirname)
             
     def load_job_data(self):
         """Load job data into form"""
-        self.name_var.set(self.job['name'])
-        self.description_text.delete(1.0, tk.END)
-        self.description_text.insert(1.0, self.job.get('description', ''))
-        self.job_type_var.set(self.job['job_type'])
-        self.command_text.delete(1.0, tk.END)
-        self.command_text.insert(1.0, self.job['command'])
-        self.enabled_var.set(self.job['enabled'])
-        self.working_dir_var.set(self.job.get('working_directory', ''))
-        
-        if self.job.get('environment_vars'):
-            self.env_vars_text.delete(1.0, tk.END)
-            self.env_vars_text.insert(1.0, self.job['environment_vars'])
-            
-        self.timeout_var.set(self.job.get('timeout_seconds', ''))
-        self.max_retries_var.set(str(self.job.get('max_retries', 0)))
-        self.retry_delay_var.set(str(self.job.get('retry_delay_seconds', 60)))
+        job = self.job
+        get = job.get
         
-        self.schedule_type_var.set(self.job.get('schedule_type', 'manual'))
-        self.interval_var.set(str(self.job.get('interval_minutes', 60)))
-        self.cron_var.set(self.job.get('cron_expression', ''))
+        # Variables, falling back to the default when the column is missing or NULL
+        for attr, key, default in self._LOAD_MAP:
+            value = get(key)
+            getattr(self, attr).set(default if value is None else value)
+            
+        # Text widgets; environment variables keep the example unless the job has some
+        set_text = self._set_text
+        set_text(self.description_text, get('description') or '')
+        set_text(self.command_text, job['command'])
+        if get('environment_vars'):
+            set_text(self.env_vars_text, job['environment_vars'])
+            
         self.update_schedule_ui()
         
-        self.notification_email_var.set(self.job.get('notification_email', ''))
-        self.notify_success_var.set(self.job.get('notify_on_success', False))
-        self.notify_failure_var.set(self.job.get('notify_on_failure', True))
+    @staticmethod
+    def _set_text(widget, value):
+        """Replace the contents of a Text widget"""
+        widget.delete(1.0, tk.END)
+        widget.insert(1.0, value)
         
-        # Load dependencies
-        dependencies = self.job_manager.get_job_dependencies(self.job['id'])
-        dep_ids = [d['depends_on_job_id'] for d in dependencies]
+    def _snapshot(self):
+        """Read each free-text field once, stripped"""
+        return {
+            'name': self.name_var.get().strip(),
+            'description': self.description_text.get(1.0, tk.END).strip(),
+            'command': self.command_text.get(1.0, tk.END).strip(),
+            'environment_vars': self.env_vars_text.get(1.0, tk.END).strip(),
+        }
         
-        for i, (job_id, job_name) in enumerate(self.available_jobs.items()):
-            if job_id in dep_ids:
-                self.deps_listbox.selection_set(i)
-                
     def validate(self):
         """Validate form data"""
-        if not self.name_var.get().strip():
+        form = self._form = self._snapshot()
+        
+        if not form['name']:
             messagebox.showerror("Validation Error", "Job name is required")
             return False
             
-        if not self.command_text.get(1.0, tk.END).strip():
+        if not form['command']:
             messagebox.showerror("Validation Error", "Command/script is required")
             return False
             
         # Validate environment variables JSON
-        env_vars = self.env_vars_text.get(1.0, tk.END).strip()
+        env_vars = form['environment_vars']
+        self._parsed_env = None
         if env_vars:
             try:
-                json.loads(env_vars)
-            except:
-                messagebox.showerror("Validation Error", "Environment variables must be valid JSON")
+                self._parsed_env = _json_loads(env_vars)
+            except ValueError as e:
+                # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
+                messagebox.showerror("Validation Error", f"Environment variables must be valid JSON:\n{e}")
+                return False
+            if not isinstance(self._parsed_env, dict):
+                messagebox.showerror("Validation Error", "Environment variables must be a JSON object")
                 return False
                 
-        # Validate numeric fields
-        if self.timeout_var.get() and not self.timeout_var.get().isdigit():
-            messagebox.showerror("Validation Error", "Timeout must be a number")
-            return False
-            
+        # Numeric fields only accept digits as typed, so this catches empty required
+        # fields and values loaded from the database: (key, variable, label, required)
+        numeric_fields = [
+            ('timeout_seconds', self.timeout_var, "Timeout", False),
+            ('max_retries', self.max_retries_var, "Max retries", True),
+            ('retry_delay_seconds', self.retry_delay_var, "Retry delay", True),
+        ]
         if self.schedule_type_var.get() == 'interval':
-            if not self.interval_var.get().isdigit():
-                messagebox.showerror("Validation Error", "Interval must be a number")
+            numeric_fields.append(('interval_minutes', self.interval_var, "Interval", True))
+            
+        self._ints = {}
+        for key, var, label, required in numeric_fields:
+            try:
+                value = _try_int(var.get())
+                valid = value is not None or not required
+            except ValueError:
+                valid = False
+            if not valid:
+                messagebox.showerror("Validation Error", f"{label} must be a number")
                 return False
-                
+            self._ints[key] = value
+            
+        self._next_run = None
         if self.schedule_type_var.get() == 'cron':
-            if not self.cron_var.get().strip():
+            cron_expression = self.cron_var.get().strip()
+            if not cron_expression:
                 messagebox.showerror("Validation Error", "Cron expression is required")
                 return False
+            if not _CRON_RE.match(cron_expression):
+                messagebox.showerror("Validation Error", "Cron expression must have five or six fields, e.g. 0 9 * * *, or be a macro such as @daily")
+                return False
                 
+            # Full check plus the first run time, so the scheduler doesn't have to compute it
+            if croniter:
+                try:
+                    self._next_run = croniter(cron_expression, datetime.now()).get_next(datetime).isoformat()
+                except (ValueError, KeyError) as e:
+                    messagebox.showerror("Validation Error", f"Invalid cron expression:\n{e}")
+                    return False
+                    
         return True
         
     def save(self):
         """Save job"""
+        # Nothing edited: close without touching the database
+        deps_unchanged = not self._deps_built or self._selected_ids == self._dep_ids
+        if self.job and not self._dirty and deps_unchanged:
+            self.dialog.destroy()
+            return
+            
         if not self.validate():
             return
             
         # Collect form data
+        form = self._form
         job_data = {
-            'name': self.name_var.get().strip(),
-            'description': self.description_text.get(1.0, tk.END).strip(),
+            'name': form['name'],
+            'description': form['description'],
             'job_type': self.job_type_var.get(),
-            'command': self.command_text.get(1.0, tk.END).strip(),
+            'command': form['command'],
             'enabled': self.enabled_var.get(),
             'working_directory': self.working_dir_var.get().strip(),
-            'environment_vars': self.env_vars_text.get(1.0, tk.END).strip() or None,
-            'timeout_seconds': int(self.timeout_var.get()) if self.timeout_var.get() else None,
-            'max_retries': int(self.max_retries_var.get()),
-            'retry_delay_seconds': int(self.retry_delay_var.get()),
+            'environment_vars': self._parsed_env,  # JobManager serializes the parsed dict
+            'timeout_seconds': self._ints['timeout_seconds'],
+            'max_retries': self._ints['max_retries'],
+            'retry_delay_seconds': self._ints['retry_delay_seconds'],
             'schedule_type': self.schedule_type_var.get(),
-            'interval_minutes': int(self.interval_var.get()) if self.schedule_type_var.get() == 'interval' else None,
+            'interval_minutes': self._ints.get('interval_minutes'),
             'cron_expression': self.cron_var.get().strip() if self.schedule_type_var.get() == 'cron' else None,
             'notification_email': self.notification_email_var.get().strip() or None,
             'notify_on_success': self.notify_success_var.get(),
             'notify_on_failure': self.notify_failure_var.get()
         }
         
+        if self._next_run:
+            job_data['next_run'] = self._next_run
+        
+        # Reject a dependency cycle before anything is written, so a failed save changes nothing;
+        # a new job can't close a cycle because no job depends on it yet
+        if self.job and self._deps_built:
+            try:
+                self.job_manager.check_job_dependencies(self.job['id'], self._selected_ids)
+            except ValueError as e:
+                messagebox.showerror("Validation Error", str(e))
+                return
+                
         try:
             if self.job:
                 # Update existing job
                 self.job_manager.update_job(self.job['id'], job_data)
                 job_id = self.job['id']
-                
-                # Update dependencies
-                # First, remove all existing dependencies
-                existing_deps = self.job_manager.get_job_dependencies(job_id)
-                for dep in existing_deps:
-                    self.job_manager.remove_job_dependency(job_id, dep['depends_on_job_id'])
             else:
                 # Create new job
                 job_id = self.job_manager.create_job(job_data)
                 
-            # Add selected dependencies
-            selected_indices = self.deps_listbox.curselection()
-            job_ids = list(self.available_jobs.keys())
-            for idx in selected_indices:
-                dep_job_id = job_ids[idx]
-                self.job_manager.add_job_dependency(job_id, dep_job_id)
+            # Update dependencies, writing only the ones that were added or removed;
+            # if the tab was never opened they are left as they were
+            if self._deps_built:
+                self.job_manager.set_job_dependencies(job_id, self._selected_ids)
                 
             job_data['id'] = job_id
             self.result = job_data
@@ -4,421 +4,981 @@ Job Manager - Database operations for job management
 
 import sqlite3
 import json
-from datetime import datetime
+import threading
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
 
 
+# Execution columns listed without the captured output, which lives in job_execution_logs
+_EXECUTION_COLUMNS = 'e.id, e.job_id, e.start_time, e.end_time, e.status, e.exit_code, e.retry_count, e.triggered_by'
+_LOG_FIELDS = ('output', 'error_output')
+
+# Job columns the database maintains itself, never written from job_data
+_JOB_READONLY = frozenset(('id', 'created_at', 'updated_at'))
+
+# Fixed parts of the generated job UPDATE
+_UPDATE_JOB_PREFIX = 'UPDATE jobs SET '
+_UPDATE_JOB_SUFFIX = ', updated_at = CURRENT_TIMESTAMP WHERE id = ?'
+
+# Whole schema, applied in one script and one transaction at startup
+_SCHEMA_SQL = '''
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT,
+    job_type TEXT NOT NULL,
+    command TEXT NOT NULL,
+    working_directory TEXT,
+    environment_vars TEXT,
+    schedule_type TEXT DEFAULT 'manual',
+    cron_expression TEXT,
+    interval_minutes INTEGER,
+    enabled BOOLEAN DEFAULT 1,
+    status TEXT DEFAULT 'idle',
+    last_run TIMESTAMP,
+    next_run TIMESTAMP,
+    next_run_epoch REAL,
+    max_retries INTEGER DEFAULT 0,
+    retry_delay_seconds INTEGER DEFAULT 60,
+    timeout_seconds INTEGER,
+    notification_email TEXT,
+    notify_on_success BOOLEAN DEFAULT 0,
+    notify_on_failure BOOLEAN DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Stored as just its primary key B-tree
+CREATE TABLE IF NOT EXISTS job_dependencies (
+    job_id INTEGER NOT NULL,
+    depends_on_job_id INTEGER NOT NULL,
+    PRIMARY KEY (job_id, depends_on_job_id),
+    FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
+    FOREIGN KEY (depends_on_job_id) REFERENCES jobs(id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS job_executions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER NOT NULL,
+    start_time TIMESTAMP NOT NULL,
+    end_time TIMESTAMP,
+    status TEXT NOT NULL,
+    exit_code INTEGER,
+    output TEXT,
+    error_output TEXT,
+    retry_count INTEGER DEFAULT 0,
+    triggered_by TEXT DEFAULT 'scheduler',
+    FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE
+);
+
+-- Captured output per execution, kept apart so execution lists stay small
+CREATE TABLE IF NOT EXISTS job_execution_logs (
+    execution_id INTEGER PRIMARY KEY,
+    output TEXT,
+    error_output TEXT,
+    FOREIGN KEY (execution_id) REFERENCES job_executions(id) ON DELETE CASCADE
+);
+
+-- Only enabled jobs, in the name order the scheduler polls them in
+CREATE INDEX IF NOT EXISTS idx_jobs_enabled_partial ON jobs(name) WHERE enabled = 1;
+DROP INDEX IF EXISTS idx_jobs_enabled;
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+CREATE INDEX IF NOT EXISTS idx_executions_status ON job_executions(status);
+
+-- Latest executions per job, covering the status so the newest one is read from the index alone;
+-- it also serves every job_id lookup, replacing the older single-column indexes
+CREATE INDEX IF NOT EXISTS idx_executions_job_start_status ON job_executions(job_id, start_time DESC, status);
+DROP INDEX IF EXISTS idx_executions_job_id;
+DROP INDEX IF EXISTS idx_executions_job_start;
+
+COMMIT;
+'''
+
+# Execution progress updates are held this long (seconds), or until their output
+# reaches this many characters, then written together; final statuses go out at once
+_FLUSH_DELAY = 0.5
+_FLUSH_CHARS = 65536
+_FINAL_STATUSES = ('completed', 'failed')
+
+# Newest executions kept in memory for get_all_executions
+_RECENT_LIMIT = 500
+
+
+def _to_epoch(timestamp):
+    """Epoch seconds of an ISO timestamp, None when it is unset or malformed"""
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError):
+        return None
+        
+        
+def _job_values(job_data):
+    """Copy of job_data ready to store, leaving the caller's dict untouched"""
+    job_data = dict(job_data)
+    
+    # Convert environment vars dict to JSON string if needed
+    if 'environment_vars' in job_data and isinstance(job_data['environment_vars'], dict):
+        job_data['environment_vars'] = json.dumps(job_data['environment_vars'])
+        
+    # Keep the scheduler's due time in step with next_run; a malformed next_run is
+    # stored as unset so the scheduler recomputes it
+    epoch = _to_epoch(job_data.get('next_run'))
+    if epoch is None and job_data.get('next_run'):
+        job_data['next_run'] = None
+    job_data['next_run_epoch'] = epoch
+    return job_data
+    
+    
+def _find_cycle(graph):
+    """Return the job IDs of one dependency cycle in graph (job ID -> set of IDs it depends on), or None
+
+    Iterative Tarjan: any strongly connected component with more than one job,
+    or a job depending on itself, is a cycle.
+    """
+    index = {}
+    low = {}
+    stack = []
+    on_stack = set()
+    
+    for root in graph:
+        if root in index:
+            continue
+            
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph[root]))]
+        
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child == node:
+                    return [node]
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(graph.get(child, ()))))
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                    
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1:
+                        return component
+                        
+    return None
+    
+    
 class JobManager:
     """Manages job database operations"""
     
+    # Single-column job updates, one fixed statement per allowed field. Only user edits
+    # bump updated_at; run bookkeeping written on every scheduler pass leaves it alone
+    _STATUS_SQL = {
+        'enabled': 'UPDATE jobs SET enabled = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?',
+        'status': 'UPDATE jobs SET status = ? WHERE id = ?',
+        'last_run': 'UPDATE jobs SET last_run = ? WHERE id = ?',
+        'next_run': 'UPDATE jobs SET next_run = ?, next_run_epoch = NULL WHERE id = ?',
+    }
+    
     def __init__(self, db_path="etl_scheduler.db"):
         self.db_path = db_path
-        self.init_database()
         
-    def init_database(self):
-        """Initialize database schema"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Jobs table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                description TEXT,
-                job_type TEXT NOT NULL,
-                command TEXT NOT NULL,
-                working_directory TEXT,
-                environment_vars TEXT,
-                schedule_type TEXT DEFAULT 'manual',
-                cron_expression TEXT,
-                interval_minutes INTEGER,
-                enabled BOOLEAN DEFAULT 1,
-                status TEXT DEFAULT 'idle',
-                last_run TIMESTAMP,
-                next_run TIMESTAMP,
-                max_retries INTEGER DEFAULT 0,
-                retry_delay_seconds INTEGER DEFAULT 60,
-                timeout_seconds INTEGER,
-                notification_email TEXT,
-                notify_on_success BOOLEAN DEFAULT 0,
-                notify_on_failure BOOLEAN DEFAULT 1,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
+        # One shared write connection in autocommit mode, serialized through the write lock
+        # so explicit BEGIN...COMMIT blocks never interleave. Reads use a connection per
+        # thread (see _reader), which WAL lets run alongside a write without seeing it
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-64000;
         ''')
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
         
-        # Job dependencies table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS job_dependencies (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_id INTEGER NOT NULL,
-                depends_on_job_id INTEGER NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
-                FOREIGN KEY (depends_on_job_id) REFERENCES jobs(id) ON DELETE CASCADE,
-                UNIQUE(job_id, depends_on_job_id)
-            )
-        ''')
+        # Every per-thread read connection, so close() can shut them all
+        self._readers = []
+        self._readers_lock = threading.Lock()
         
-        # Job executions table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS job_executions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_id INTEGER NOT NULL,
-                start_time TIMESTAMP NOT NULL,
-                end_time TIMESTAMP,
-                status TEXT NOT NULL,
-                exit_code INTEGER,
-                output TEXT,
-                error_output TEXT,
-                retry_count INTEGER DEFAULT 0,
-                triggered_by TEXT DEFAULT 'scheduler',
-                FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE
-            )
-        ''')
+        # Generated SQL keyed by statement kind and sorted column names, so the same
+        # columns always produce the same text and hit sqlite3's statement cache
+        self._stmt_cache = {}
+        
+        # Newest executions with their job names, oldest first; None until first read
+        # and whenever a change can't be patched in. Guarded by the write lock
+        self._recent_executions = None
         
-        # Create indexes
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_enabled ON jobs(enabled)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_executions_job_id ON job_executions(job_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_executions_status ON job_executions(status)')
+        # Buffered update_execution fields per execution ID and the timer that flushes them
+        self._pending_executions = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer = None
         
-        conn.commit()
-        conn.close()
+        self.init_database()
         
+        # Dependency graph (job ID -> set of IDs it depends on), mirrored from
+        # job_dependencies and kept current by the methods that change it
+        self._dep_graph = {}
+        for job_id, depends_on_job_id in self.get_all_dependency_edges():
+            self._dep_graph.setdefault(job_id, set()).add(depends_on_job_id)
+            
+    def init_database(self):
+        """Initialize database schema"""
+        self.conn.executescript(_SCHEMA_SQL)
+        self._migrate_jobs(self.conn.cursor())
+        self._migrate_dependencies(self.conn.cursor())
+        
+    def _migrate_jobs(self, cursor):
+        """Add the next_run_epoch column to a jobs table created before it existed"""
+        cursor.execute('PRAGMA table_info(jobs)')
+        if 'next_run_epoch' not in {row['name'] for row in cursor.fetchall()}:
+            cursor.execute('ALTER TABLE jobs ADD COLUMN next_run_epoch REAL')
+            
+    def _migrate_dependencies(self, cursor):
+        """Rebuild a job_dependencies table from the old rowid layout, keeping its pairs"""
+        cursor.execute('PRAGMA table_info(job_dependencies)')
+        if 'id' not in {row['name'] for row in cursor.fetchall()}:
+            return
+            
+        cursor.execute('BEGIN')
+        try:
+            cursor.execute('''
+                CREATE TABLE job_dependencies_new (
+                    job_id INTEGER NOT NULL,
+                    depends_on_job_id INTEGER NOT NULL,
+                    PRIMARY KEY (job_id, depends_on_job_id),
+                    FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
+                    FOREIGN KEY (depends_on_job_id) REFERENCES jobs(id) ON DELETE CASCADE
+                ) WITHOUT ROWID
+            ''')
+            cursor.execute('''
+                INSERT OR IGNORE INTO job_dependencies_new (job_id, depends_on_job_id)
+                SELECT job_id, depends_on_job_id FROM job_dependencies
+            ''')
+            cursor.execute('DROP TABLE job_dependencies')
+            cursor.execute('ALTER TABLE job_dependencies_new RENAME TO job_dependencies')
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+            
     def get_connection(self):
-        """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get the shared database connection"""
+        return self.conn
+        
+    def _reader(self):
+        """Get this thread's read-only connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Only this thread uses it, but close() shuts it from another
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.executescript('''
+                PRAGMA query_only=ON;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA mmap_size=268435456;
+                PRAGMA cache_size=-64000;
+            ''')
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
         return conn
         
-    def create_job(self, job_data):
-        """Create a new job"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Convert environment vars dict to JSON string if needed
-        if 'environment_vars' in job_data and isinstance(job_data['environment_vars'], dict):
-            job_data['environment_vars'] = json.dumps(job_data['environment_vars'])
-        
-        fields = []
-        values = []
-        for key, value in job_data.items():
-            if key not in ['id', 'created_at', 'updated_at']:
-                fields.append(key)
-                values.append(value)
+    def close(self):
+        """Write buffered execution updates and close every connection, letting SQLite checkpoint the WAL"""
+        self.flush_executions()
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for conn in readers:
+            conn.close()
+        self.conn.close()
         
-        placeholders = ','.join(['?' for _ in fields])
-        field_names = ','.join(fields)
+    @contextmanager
+    def _cursor(self, write=False):
+        """Yield a cursor and close it afterwards; writes hold the write lock on the shared connection"""
+        cursor = self.conn.cursor() if write else self._reader().cursor()
+        try:
+            if write:
+                with self._write_lock:
+                    yield cursor
+            else:
+                yield cursor
+        finally:
+            cursor.close()
+            
+    def _build_sql(self, kind, keys):
+        """Get the cached INSERT or UPDATE statement for a table and sorted column names"""
+        query = self._stmt_cache.get((kind, keys))
+        if query is None:
+            if kind == 'insert_job':
+                query = f"INSERT INTO jobs ({','.join(keys)}) VALUES ({','.join('?' * len(keys))})"
+            elif kind == 'update_job':
+                query = _UPDATE_JOB_PREFIX + ', '.join([f"{key} = ?" for key in keys]) + _UPDATE_JOB_SUFFIX
+            elif kind == 'upsert_log':
+                query = (f"INSERT INTO job_execution_logs (execution_id, {', '.join(keys)}) "
+                         f"VALUES (?{', ?' * len(keys)}) ON CONFLICT(execution_id) DO UPDATE SET "
+                         f"{', '.join(f'{key} = excluded.{key}' for key in keys)}")
+            else:
+                query = f"UPDATE job_executions SET {', '.join(f'{key} = ?' for key in keys)} WHERE id = ?"
+            self._stmt_cache[(kind, keys)] = query
+        return query
+        
+    def _status_sql(self, field):
+        """Get the update statement for a status field, rejecting unknown columns"""
+        try:
+            return self._STATUS_SQL[field]
+        except KeyError:
+            raise ValueError(f"Unknown job status field: {field}") from None
+            
+    def _build_job_insert(self, job_data):
+        """Build the INSERT statement and values for a job"""
+        job_data = _job_values(job_data)
         
-        query = f'INSERT INTO jobs ({field_names}) VALUES ({placeholders})'
-        cursor.execute(query, values)
+        keys = tuple(sorted(job_data.keys() - _JOB_READONLY))
+        values = [job_data[key] for key in keys]
         
-        job_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        return self._build_sql('insert_job', keys), values
         
+    def create_job(self, job_data):
+        """Create a new job"""
+        query, values = self._build_job_insert(job_data)
+        with self._cursor(write=True) as cursor:
+            cursor.execute(query, values)
+            job_id = cursor.lastrowid
+            
         return job_id
         
+    def create_jobs_bulk(self, jobs, progress_callback=None, progress_every=500):
+        """Create many jobs in a single transaction, returns the number created"""
+        count = 0
+        with self._cursor(write=True) as cursor:
+            cursor.execute('BEGIN')
+            try:
+                for job_data in jobs:
+                    query, values = self._build_job_insert(job_data)
+                    cursor.execute(query, values)
+                    count += 1
+                    
+                    if progress_callback and count % progress_every == 0:
+                        progress_callback(count)
+                        
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+                
+        return count
+        
     def update_job(self, job_id, job_data):
         """Update an existing job"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Convert environment vars dict to JSON string if needed
-        if 'environment_vars' in job_data and isinstance(job_data['environment_vars'], dict):
-            job_data['environment_vars'] = json.dumps(job_data['environment_vars'])
-        
-        fields = []
-        values = []
-        for key, value in job_data.items():
-            if key not in ['id', 'created_at']:
-                fields.append(f"{key} = ?")
-                values.append(value)
+        # The schedule may have changed, so take the due time from next_run when the
+        # edit sets one and otherwise leave it for the scheduler to recompute
+        job_data = _job_values(job_data)
         
+        keys = tuple(sorted(job_data.keys() - _JOB_READONLY))
+        values = [job_data[key] for key in keys]
         values.append(job_id)
         
-        query = f"UPDATE jobs SET {', '.join(fields)}, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
-        cursor.execute(query, values)
-        
-        conn.commit()
-        conn.close()
+        query = self._build_sql('update_job', keys)
+        with self._cursor(write=True) as cursor:
+            cursor.execute(query, values)
+            if 'name' in job_data:
+                self._recent_executions = None
         
     def delete_job(self, job_id):
         """Delete a job and its dependencies"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM jobs WHERE id = ?', (job_id,))
-        
-        conn.commit()
-        conn.close()
+        with self._cursor(write=True) as cursor:
+            # foreign_keys is off, so the dependency rows don't cascade on their own
+            cursor.execute('BEGIN')
+            try:
+                cursor.execute('DELETE FROM job_dependencies WHERE job_id = ? OR depends_on_job_id = ?',
+                               (job_id, job_id))
+                cursor.execute('DELETE FROM jobs WHERE id = ?', (job_id,))
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+                
+            self._recent_executions = None
+            self._dep_graph.pop(job_id, None)
+            for deps in self._dep_graph.values():
+                deps.discard(job_id)
         
     def get_job(self, job_id):
         """Get a job by ID"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM jobs WHERE id = ?', (job_id,))
-        row = cursor.fetchone()
-        
-        conn.close()
-        
-        if row:
-            return dict(row)
-        return None
+        with self._cursor() as cursor:
+            cursor.execute('SELECT * FROM jobs WHERE id = ?', (job_id,))
+            row = cursor.fetchone()
+            
+            if row:
+                return dict(row)
+            return None
+        
+    def get_jobs_by_ids(self, job_ids):
+        """Get several jobs in one query, keyed by job ID"""
+        job_ids = list(job_ids)
+        if not job_ids:
+            return {}
+            
+        with self._cursor() as cursor:
+            placeholders = ','.join('?' * len(job_ids))
+            cursor.execute(f'SELECT * FROM jobs WHERE id IN ({placeholders})', job_ids)
+            rows = cursor.fetchall()
+            
+            return {row['id']: dict(row) for row in rows}
         
     def get_all_jobs(self):
         """Get all jobs"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM jobs ORDER BY name')
-        rows = cursor.fetchall()
+        with self._cursor() as cursor:
+            cursor.execute('SELECT * FROM jobs ORDER BY name')
+            rows = cursor.fetchall()
+            
+            return [dict(row) for row in rows]
         
-        conn.close()
+    def get_jobs_with_deps_for(self, job_id):
+        """Get all jobs plus the set of IDs the given job depends on, in one query"""
+        with self._cursor() as cursor:
+            cursor.execute('''
+                SELECT j.*, d.job_id IS NOT NULL AS is_dependency
+                FROM jobs j
+                LEFT JOIN job_dependencies d ON d.depends_on_job_id = j.id AND d.job_id = ?
+                ORDER BY j.name
+            ''', (job_id,))
+            
+            jobs = []
+            dep_ids = set()
+            for row in cursor.fetchall():
+                job = dict(row)
+                if job.pop('is_dependency'):
+                    dep_ids.add(job['id'])
+                jobs.append(job)
+                
+            return jobs, dep_ids
         
-        return [dict(row) for row in rows]
+    def get_job_count(self):
+        """Get the number of jobs"""
+        with self._cursor() as cursor:
+            cursor.execute('SELECT COUNT(*) FROM jobs')
+            
+            return cursor.fetchone()[0]
         
+    def iter_all_jobs(self):
+        """Yield all jobs one at a time without loading them into memory"""
+        for row in self._reader().execute('SELECT * FROM jobs ORDER BY name'):
+            yield dict(row)
+            
     def get_enabled_jobs(self):
         """Get all enabled jobs"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM jobs WHERE enabled = 1 ORDER BY name')
-        rows = cursor.fetchall()
-        
-        conn.close()
-        
-        return [dict(row) for row in rows]
+        with self._cursor() as cursor:
+            cursor.execute('SELECT * FROM jobs WHERE enabled = 1 ORDER BY name')
+            rows = cursor.fetchall()
+            
+            return [dict(row) for row in rows]
         
+    def get_schedulable_jobs(self):
+        """Get the scheduling columns of all enabled jobs as sqlite3.Row objects"""
+        with self._cursor() as cursor:
+            cursor.execute('''
+                SELECT id, name, schedule_type, interval_minutes, cron_expression, last_run, next_run,
+                       next_run_epoch
+                FROM jobs WHERE enabled = 1 ORDER BY name
+            ''')
+            
+            return cursor.fetchall()
+            
     def update_job_status(self, job_id, field, value):
         """Update job status field"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(f'UPDATE jobs SET {field} = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?', 
-                      (value, job_id))
-        
-        conn.commit()
-        conn.close()
-        
+        query = self._status_sql(field)
+        with self._cursor(write=True) as cursor:
+            cursor.execute(query, (value, job_id))
+        
+    def update_statuses_bulk(self, updates):
+        """Apply many (job_id, field, value) updates in a single transaction"""
+        by_field = {}
+        for job_id, field, value in updates:
+            by_field.setdefault(self._status_sql(field), []).append((value, job_id))
+            
+        with self._cursor(write=True) as cursor:
+            cursor.execute('BEGIN')
+            try:
+                for query, rows in by_field.items():
+                    cursor.executemany(query, rows)
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+                
     def update_job_last_run(self, job_id, timestamp=None):
         """Update job last run timestamp"""
         if timestamp is None:
             timestamp = datetime.now().isoformat()
             
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('UPDATE jobs SET last_run = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?', 
-                      (timestamp, job_id))
-        
-        conn.commit()
-        conn.close()
+        with self._cursor(write=True) as cursor:
+            cursor.execute(self._STATUS_SQL['last_run'], (timestamp, job_id))
         
     def update_job_next_run(self, job_id, timestamp):
-        """Update job next run timestamp"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('UPDATE jobs SET next_run = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?', 
-                      (timestamp, job_id))
-        
-        conn.commit()
-        conn.close()
+        """Update job next run timestamp, with its epoch seconds for the scheduler's due check"""
+        with self._cursor(write=True) as cursor:
+            cursor.execute('UPDATE jobs SET next_run = ?, next_run_epoch = ? WHERE id = ?', 
+                          (timestamp, _to_epoch(timestamp), job_id))
+        
+    def update_next_runs_bulk(self, next_runs):
+        """Set many jobs' next run timestamps ({job_id: timestamp}) in a single transaction"""
+        rows = [(timestamp, _to_epoch(timestamp), job_id) for job_id, timestamp in next_runs.items()]
+        with self._cursor(write=True) as cursor:
+            cursor.execute('BEGIN')
+            try:
+                cursor.executemany('UPDATE jobs SET next_run = ?, next_run_epoch = ? WHERE id = ?', rows)
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+                
+    def mark_job_started(self, job_id, started_at=None):
+        """Set a job running and record its last run time in one statement"""
+        if started_at is None:
+            started_at = datetime.now().isoformat()
+            
+        with self._cursor(write=True) as cursor:
+            cursor.execute("UPDATE jobs SET status = 'running', last_run = ? WHERE id = ?", 
+                          (started_at, job_id))
+            
+    def mark_job_finished(self, job_id, status, next_run=None):
+        """Set a job's final status, and its next run time when given, in one statement"""
+        with self._cursor(write=True) as cursor:
+            if next_run is None:
+                cursor.execute(self._STATUS_SQL['status'], (status, job_id))
+            else:
+                cursor.execute('UPDATE jobs SET status = ?, next_run = ?, next_run_epoch = ? WHERE id = ?', 
+                              (status, next_run, _to_epoch(next_run), job_id))
+                
+    def _check_acyclic(self, changes):
+        """Raise ValueError if applying changes (job ID -> new dependency set) would create a cycle"""
+        graph = dict(self._dep_graph)
+        graph.update(changes)
+        cycle = _find_cycle(graph)
+        if cycle:
+            raise ValueError(f"Dependencies would create a cycle between jobs {sorted(cycle)}")
+            
+    def check_job_dependencies(self, job_id, depends_on_job_ids):
+        """Raise ValueError if giving a job these dependencies would create a cycle, without writing"""
+        with self._write_lock:
+            self._check_acyclic({job_id: set(depends_on_job_ids)})
+            
+    def get_dependencies_cached(self, job_id):
+        """Get the IDs a job depends on from the in-memory graph, without a query"""
+        return set(self._dep_graph.get(job_id, ()))
         
     def add_job_dependency(self, job_id, depends_on_job_id):
-        """Add a job dependency"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
+        """Add a job dependency, returning False if it already exists; raises ValueError on a cycle"""
+        with self._cursor(write=True) as cursor:
+            deps = self._dep_graph.get(job_id, set())
+            if depends_on_job_id in deps:
+                return False
+            self._check_acyclic({job_id: deps | {depends_on_job_id}})
+            
             cursor.execute('''
-                INSERT INTO job_dependencies (job_id, depends_on_job_id) 
+                INSERT OR IGNORE INTO job_dependencies (job_id, depends_on_job_id) 
                 VALUES (?, ?)
             ''', (job_id, depends_on_job_id))
-            conn.commit()
-            return True
-        except sqlite3.IntegrityError:
-            return False
-        finally:
-            conn.close()
+            self._dep_graph.setdefault(job_id, set()).add(depends_on_job_id)
+            
+            return cursor.rowcount == 1
+            
+    def add_job_dependencies_bulk(self, pairs):
+        """Add many (job_id, depends_on_job_id) pairs in a single transaction, skipping existing ones"""
+        pairs = list(pairs)
+        with self._cursor(write=True) as cursor:
+            changes = {}
+            for job_id, depends_on_job_id in pairs:
+                if job_id not in changes:
+                    changes[job_id] = set(self._dep_graph.get(job_id, ()))
+                changes[job_id].add(depends_on_job_id)
+            self._check_acyclic(changes)
+            
+            cursor.execute('BEGIN')
+            try:
+                cursor.executemany('''
+                    INSERT OR IGNORE INTO job_dependencies (job_id, depends_on_job_id) 
+                    VALUES (?, ?)
+                ''', pairs)
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+                
+            self._dep_graph.update(changes)
             
     def remove_job_dependency(self, job_id, depends_on_job_id):
         """Remove a job dependency"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            DELETE FROM job_dependencies 
-            WHERE job_id = ? AND depends_on_job_id = ?
-        ''', (job_id, depends_on_job_id))
-        
-        conn.commit()
-        conn.close()
-        
+        with self._cursor(write=True) as cursor:
+            cursor.execute('''
+                DELETE FROM job_dependencies 
+                WHERE job_id = ? AND depends_on_job_id = ?
+            ''', (job_id, depends_on_job_id))
+            self._dep_graph.get(job_id, set()).discard(depends_on_job_id)
+            
+    def set_job_dependencies(self, job_id, depends_on_job_ids):
+        """Make a job's dependencies match the given IDs, writing only the differences; raises ValueError on a cycle"""
+        depends_on_job_ids = set(depends_on_job_ids)
+        with self._cursor(write=True) as cursor:
+            existing = self._dep_graph.get(job_id, set())
+            if depends_on_job_ids == existing:
+                return
+            self._check_acyclic({job_id: depends_on_job_ids})
+            
+            cursor.execute('BEGIN')
+            try:
+                cursor.executemany('''
+                    DELETE FROM job_dependencies 
+                    WHERE job_id = ? AND depends_on_job_id = ?
+                ''', [(job_id, dep_id) for dep_id in existing - depends_on_job_ids])
+                cursor.executemany('''
+                    INSERT INTO job_dependencies (job_id, depends_on_job_id) 
+                    VALUES (?, ?)
+                ''', [(job_id, dep_id) for dep_id in depends_on_job_ids - existing])
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+                
+            self._dep_graph[job_id] = depends_on_job_ids
+            
     def get_job_dependencies(self, job_id):
         """Get all dependencies for a job"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM job_dependencies 
-            WHERE job_id = ?
-        ''', (job_id,))
-        
-        rows = cursor.fetchall()
-        conn.close()
+        with self._cursor() as cursor:
+            cursor.execute('''
+                SELECT * FROM job_dependencies 
+                WHERE job_id = ?
+            ''', (job_id,))
+            
+            rows = cursor.fetchall()
+            
+            return [dict(row) for row in rows]
         
-        return [dict(row) for row in rows]
+    def get_all_dependency_edges(self):
+        """Get every (job_id, depends_on_job_id) pair"""
+        with self._cursor() as cursor:
+            cursor.execute('SELECT job_id, depends_on_job_id FROM job_dependencies')
+            
+            return [tuple(row) for row in cursor.fetchall()]
         
     def get_dependent_jobs(self, job_id):
         """Get all jobs that depend on this job"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT j.* FROM jobs j
-            JOIN job_dependencies d ON j.id = d.job_id
-            WHERE d.depends_on_job_id = ?
-        ''', (job_id,))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        return [dict(row) for row in rows]
+        with self._cursor() as cursor:
+            cursor.execute('''
+                SELECT j.* FROM jobs j
+                JOIN job_dependencies d ON j.id = d.job_id
+                WHERE d.depends_on_job_id = ?
+            ''', (job_id,))
+            
+            rows = cursor.fetchall()
+            
+            return [dict(row) for row in rows]
         
     def check_dependencies_met(self, job_id):
         """Check if all dependencies for a job are met (completed successfully)"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Get all dependencies
-        cursor.execute('''
-            SELECT depends_on_job_id FROM job_dependencies 
-            WHERE job_id = ?
-        ''', (job_id,))
-        
-        dependencies = cursor.fetchall()
-        
-        if not dependencies:
-            conn.close()
+        if not self._dep_graph.get(job_id):
             return True
             
-        # Check each dependency's last execution
-        for dep in dependencies:
-            dep_job_id = dep[0]
-            
-            # Get the most recent execution of the dependency
+        with self._cursor() as cursor:
+            # Count dependencies whose most recent execution is missing or not completed
             cursor.execute('''
-                SELECT status FROM job_executions 
-                WHERE job_id = ? 
-                ORDER BY start_time DESC 
-                LIMIT 1
-            ''', (dep_job_id,))
-            
-            result = cursor.fetchone()
+                SELECT COUNT(*) FROM job_dependencies d
+                WHERE d.job_id = ?
+                  AND COALESCE((
+                      SELECT e.status FROM job_executions e
+                      WHERE e.job_id = d.depends_on_job_id
+                      ORDER BY e.start_time DESC
+                      LIMIT 1
+                  ), '') != 'completed'
+            ''', (job_id,))
             
-            # If no execution or last execution failed, dependencies not met
-            if not result or result[0] != 'completed':
-                conn.close()
-                return False
-                
-        conn.close()
-        return True
-        
-    def create_execution(self, job_id, triggered_by='scheduler'):
-        """Create a new job execution record"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+            return cursor.fetchone()[0] == 0
         
+    def _insert_execution(self, cursor, job_id, triggered_by, start_time):
+        """Insert a running execution record and add it to the recent cache, returns its ID"""
         cursor.execute('''
             INSERT INTO job_executions (job_id, start_time, status, triggered_by)
             VALUES (?, ?, 'running', ?)
-        ''', (job_id, datetime.now().isoformat(), triggered_by))
-        
+        ''', (job_id, start_time, triggered_by))
         execution_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
         
+        if self._recent_executions is not None:
+            cursor.execute(f'''
+                SELECT {_EXECUTION_COLUMNS}, j.name as job_name 
+                FROM job_executions e
+                JOIN jobs j ON e.job_id = j.id
+                WHERE e.id = ?
+            ''', (execution_id,))
+            row = cursor.fetchone()
+            if row:
+                self._recent_executions.append(dict(row))
+                
         return execution_id
         
-    def update_execution(self, execution_id, **kwargs):
-        """Update execution record"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        fields = []
-        values = []
-        for key, value in kwargs.items():
-            fields.append(f"{key} = ?")
-            values.append(value)
+    def get_completed_job_ids(self):
+        """Get the IDs of jobs whose most recent execution completed successfully"""
+        with self._cursor() as cursor:
+            cursor.execute('''
+                SELECT j.id FROM jobs j
+                WHERE (
+                    SELECT e.status FROM job_executions e
+                    WHERE e.job_id = j.id
+                    ORDER BY e.start_time DESC
+                    LIMIT 1
+                ) = 'completed'
+            ''')
             
-        values.append(execution_id)
-        
-        query = f"UPDATE job_executions SET {', '.join(fields)} WHERE id = ?"
-        cursor.execute(query, values)
+            return {row[0] for row in cursor.fetchall()}
+            
+    def create_execution(self, job_id, triggered_by='scheduler'):
+        """Create a new job execution record"""
+        with self._cursor(write=True) as cursor:
+            return self._insert_execution(cursor, job_id, triggered_by, datetime.now().isoformat())
+            
+    def start_execution(self, job_id, triggered_by='scheduler'):
+        """Create a running execution and mark its job started in one transaction, returns the execution ID"""
+        started_at = datetime.now().isoformat()
+        with self._cursor(write=True) as cursor:
+            cursor.execute('BEGIN')
+            try:
+                execution_id = self._insert_execution(cursor, job_id, triggered_by, started_at)
+                cursor.execute("UPDATE jobs SET status = 'running', last_run = ? WHERE id = ?", 
+                              (started_at, job_id))
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+                
+        return execution_id
         
-        conn.commit()
-        conn.close()
+    def finish_execution(self, execution_id, job_id, **kwargs):
+        """Write an execution's final fields, with any pending updates, and its job's status in one transaction"""
+        with self._pending_lock:
+            self._pending_executions.setdefault(execution_id, {}).update(kwargs)
+            
+        self.flush_executions(extra=[(self._STATUS_SQL['status'], (kwargs['status'], job_id))])
+        
+    def create_executions_bulk(self, rows):
+        """Record many (job_id, start_time, status, triggered_by) executions in a single transaction"""
+        with self._cursor(write=True) as cursor:
+            cursor.execute('BEGIN')
+            try:
+                cursor.executemany('''
+                    INSERT INTO job_executions (job_id, start_time, status, triggered_by)
+                    VALUES (?, ?, ?, ?)
+                ''', rows)
+                cursor.execute('COMMIT')
+                self._recent_executions = None
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+                
+    def update_execution(self, execution_id, **kwargs):
+        """Update execution record, storing captured output in job_execution_logs"""
+        # Progress updates are coalesced and written shortly after; an update that sets a
+        # final status, or carries a lot of output, writes everything pending right away
+        with self._pending_lock:
+            pending = self._pending_executions.setdefault(execution_id, {})
+            pending.update(kwargs)
+            
+            output_size = sum(len(pending[key]) for key in _LOG_FIELDS if isinstance(pending.get(key), str))
+            if kwargs.get('status') not in _FINAL_STATUSES and output_size < _FLUSH_CHARS:
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(_FLUSH_DELAY, self.flush_executions)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return
+                
+        self.flush_executions()
+        
+    def flush_executions(self, extra=()):
+        """Write all buffered execution updates, and any extra (query, values) statements, in a single transaction"""
+        with self._cursor(write=True) as cursor:
+            # Taken under the write lock so flushes reach the database in order
+            with self._pending_lock:
+                pending, self._pending_executions = self._pending_executions, {}
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            if not pending and not extra:
+                return
+                
+            statements = list(extra)
+            for execution_id, kwargs in pending.items():
+                keys = tuple(sorted(key for key in kwargs if key not in _LOG_FIELDS))
+                if keys:
+                    values = [kwargs[key] for key in keys]
+                    values.append(execution_id)
+                    statements.append((self._build_sql('update_execution', keys), values))
+                    
+                log_keys = tuple(key for key in _LOG_FIELDS if key in kwargs)
+                if log_keys:
+                    values = [execution_id] + [kwargs[key] for key in log_keys]
+                    statements.append((self._build_sql('upsert_log', log_keys), values))
+                    
+            cursor.execute('BEGIN')
+            try:
+                for query, values in statements:
+                    cursor.execute(query, values)
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+                
+            # Patch the cached copies, searching from the newest end
+            if self._recent_executions is not None:
+                for execution in reversed(self._recent_executions):
+                    kwargs = pending.get(execution['id'])
+                    if kwargs:
+                        execution.update((key, value) for key, value in kwargs.items() if key not in _LOG_FIELDS)
+                        
+                        
+    def prune_executions(self, keep_per_job=100, keep_days=30):
+        """Delete finished executions beyond the newest keep_per_job per job or older than keep_days"""
+        cutoff = (datetime.now() - timedelta(days=keep_days)).isoformat()
+        
+        with self._cursor(write=True) as cursor:
+            cursor.execute('BEGIN')
+            try:
+                cursor.execute('''
+                    DELETE FROM job_executions WHERE status != 'running' AND id IN (
+                        SELECT id FROM (
+                            SELECT id, start_time, 
+                                   ROW_NUMBER() OVER (PARTITION BY job_id ORDER BY start_time DESC) AS rn
+                            FROM job_executions
+                        ) WHERE rn > ? OR start_time < ?
+                    )
+                ''', (keep_per_job, cutoff))
+                deleted = cursor.rowcount
+                cursor.execute('''
+                    DELETE FROM job_execution_logs 
+                    WHERE execution_id NOT IN (SELECT id FROM job_executions)
+                ''')
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+                
+            if deleted:
+                self._recent_executions = None
+                # Hand the freed WAL space back to the filesystem
+                cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                
+        return deleted
         
     def get_execution(self, execution_id):
         """Get execution by ID"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM job_executions WHERE id = ?', (execution_id,))
-        row = cursor.fetchone()
-        
-        conn.close()
-        
-        if row:
-            return dict(row)
-        return None
-        
-    def get_job_executions(self, job_id, limit=50):
-        """Get recent executions for a job"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM job_executions 
-            WHERE job_id = ? 
-            ORDER BY start_time DESC 
-            LIMIT ?
-        ''', (job_id, limit))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        return [dict(row) for row in rows]
-        
-    def get_all_executions(self, limit=100, status_filter=None):
-        """Get all executions with optional status filter"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        if status_filter and status_filter != "All":
-            cursor.execute('''
-                SELECT e.*, j.name as job_name 
+        with self._cursor() as cursor:
+            # Executions recorded before the logs table keep their output inline
+            cursor.execute(f'''
+                SELECT {_EXECUTION_COLUMNS},
+                       COALESCE(l.output, e.output) AS output,
+                       COALESCE(l.error_output, e.error_output) AS error_output
                 FROM job_executions e
-                JOIN jobs j ON e.job_id = j.id
-                WHERE e.status = ?
-                ORDER BY e.start_time DESC 
-                LIMIT ?
-            ''', (status_filter, limit))
-        else:
-            cursor.execute('''
-                SELECT e.*, j.name as job_name 
-                FROM job_executions e
-                JOIN jobs j ON e.job_id = j.id
+                LEFT JOIN job_execution_logs l ON l.execution_id = e.id
+                WHERE e.id = ?
+            ''', (execution_id,))
+            row = cursor.fetchone()
+            
+            if row:
+                return dict(row)
+            return None
+        
+    def get_job_executions(self, job_id, limit=50, offset=0):
+        """Get recent executions for a job, one page of limit rows starting at offset"""
+        with self._cursor() as cursor:
+            cursor.execute(f'''
+                SELECT {_EXECUTION_COLUMNS} FROM job_executions e
+                WHERE e.job_id = ? 
                 ORDER BY e.start_time DESC 
-                LIMIT ?
-            ''', (limit,))
-        
-        rows = cursor.fetchall()
-        conn.close()
+                LIMIT ? OFFSET ?
+            ''', (job_id, limit, offset))
+            
+            rows = cursor.fetchall()
+            
+            return [dict(row) for row in rows]
+        
+    def get_all_executions(self, limit=100, status_filter=None, offset=0):
+        """Get all executions with optional status filter, one page of limit rows starting at offset"""
+        # Served from the in-memory list while it holds enough matching executions
+        with self._cursor(write=True) as cursor:
+            if self._recent_executions is None:
+                cursor.execute(f'''
+                    SELECT {_EXECUTION_COLUMNS}, j.name as job_name 
+                    FROM job_executions e
+                    JOIN jobs j ON e.job_id = j.id
+                    ORDER BY e.start_time DESC 
+                    LIMIT ?
+                ''', (_RECENT_LIMIT,))
+                rows = cursor.fetchall()
+                self._recent_executions = deque((dict(row) for row in reversed(rows)), maxlen=_RECENT_LIMIT)
+            recent = list(self._recent_executions)
+            
+        filtered = status_filter and status_filter != "All"
+        matches = [execution for execution in reversed(recent) 
+                   if not filtered or execution['status'] == status_filter][offset:offset + limit]
         
-        return [dict(row) for row in rows]
\ No newline at end of file
+        # A list shorter than the cap holds every execution, so it is complete even when short
+        if len(matches) == limit or len(recent) < _RECENT_LIMIT:
+            return [dict(execution) for execution in matches]
+            
+        with self._cursor() as cursor:
+            if status_filter and status_filter != "All":
+                cursor.execute(f'''
+                    SELECT {_EXECUTION_COLUMNS}, j.name as job_name 
+                    FROM job_executions e
+                    JOIN jobs j ON e.job_id = j.id
+                    WHERE e.status = ?
+                    ORDER BY e.start_time DESC 
+                    LIMIT ? OFFSET ?
+                ''', (status_filter, limit, offset))
+            else:
+                cursor.execute(f'''
+                    SELECT {_EXECUTION_COLUMNS}, j.name as job_name 
+                    FROM job_executions e
+                    JOIN jobs j ON e.job_id = j.id
+                    ORDER BY e.start_time DESC 
+                    LIMIT ? OFFSET ?
+                ''', (limit, offset))
+            
+            rows = cursor.fetchall()
+            
+            return [dict(row) for row in rows]
+            
+    def iter_all_executions(self, status_filter=None):
+        """Yield executions newest first, one at a time, without building the whole list"""
+        query = f'''
+            SELECT {_EXECUTION_COLUMNS}, j.name as job_name 
+            FROM job_executions e
+            JOIN jobs j ON e.job_id = j.id
+            {'WHERE e.status = ?' if status_filter and status_filter != "All" else ''}
+            ORDER BY e.start_time DESC
+        '''
+        params = (status_filter,) if status_filter and status_filter != "All" else ()
+        
+        with self._cursor() as cursor:
+            for row in cursor.execute(query, params):
+                yield dict(row)
\ No newline at end of file
@@ -6,6 +6,9 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext
 from datetime import datetime
 
+# Characters inserted per idle tick when loading captured output
+_CHUNK_SIZE = 65536
+
 
 class LogViewer:
     """Dialog for viewing execution logs"""
@@ -14,6 +17,10 @@ class LogViewer:
         self.parent = parent
         self.execution = execution
         
+        # Parse the timestamps once for the header and the duration
+        self.start_dt = self.parse_timestamp(execution['start_time'])
+        self.end_dt = self.parse_timestamp(execution.get('end_time'))
+        
         # Create dialog
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(f"Execution Log - ID: {execution['id']}")
@@ -36,8 +43,8 @@ Exit Code: {self.execution.get('exit_code', 'N/A')}
 Retry Count: {self.execution.get('retry_count', 0)}
 Triggered By: {self.execution.get('triggered_by', 'scheduler')}
 
-Start Time: {self.format_timestamp(self.execution['start_time'])}
-End Time: {self.format_timestamp(self.execution.get('end_time'))}
+Start Time: {self.format_timestamp(self.execution['start_time'], self.start_dt)}
+End Time: {self.format_timestamp(self.execution.get('end_time'), self.end_dt)}
 Duration: {self.calculate_duration()}
 """
         
@@ -60,12 +67,8 @@ Duration: {self.calculate_duration()}
         )
         self.output_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        output = self.execution.get('output', '')
-        if output:
-            self.output_text.insert(1.0, output)
-        else:
-            self.output_text.insert(1.0, "No output captured")
         self.output_text.config(state=tk.DISABLED)
+        self._load_chunked(self.output_text, self.execution.get('output') or "No output captured")
         
         # Error output tab
         error_frame = ttk.Frame(notebook)
@@ -80,12 +83,8 @@ Duration: {self.calculate_duration()}
         )
         self.error_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        error = self.execution.get('error_output', '')
-        if error:
-            self.error_text.insert(1.0, error)
-        else:
-            self.error_text.insert(1.0, "No errors")
         self.error_text.config(state=tk.DISABLED)
+        self._load_chunked(self.error_text, self.execution.get('error_output') or "No errors")
         
         # Close button
         button_frame = ttk.Frame(self.dialog)
@@ -96,43 +95,60 @@ Duration: {self.calculate_duration()}
         ttk.Button(button_frame, text="Copy Output", command=self.copy_output, 
                   width=15).pack(side=tk.RIGHT, padx=5)
         
-    def format_timestamp(self, timestamp):
-        """Format timestamp for display"""
+    def _load_chunked(self, widget, data, pos=0):
+        """Insert data into a read-only Text widget one slice per idle tick, so big logs don't freeze the UI"""
+        if not widget.winfo_exists():
+            return
+            
+        chunk = data[pos:pos + _CHUNK_SIZE]
+        if chunk:
+            widget.config(state=tk.NORMAL)
+            widget.insert(tk.END, chunk)
+            widget.config(state=tk.DISABLED)
+            self.dialog.after_idle(self._load_chunked, widget, data, pos + _CHUNK_SIZE)
+            
+    @staticmethod
+    def parse_timestamp(timestamp):
+        """Parse an ISO timestamp, or None if it is missing or malformed"""
         if not timestamp:
-            return "N/A"
+            return None
         try:
-            dt = datetime.fromisoformat(timestamp)
-            return dt.strftime('%Y-%m-%d %H:%M:%S')
-        except:
-            return timestamp
+            return datetime.fromisoformat(timestamp)
+        except (TypeError, ValueError):
+            return None
             
+    def format_timestamp(self, timestamp, dt):
+        """Format a timestamp for display from its parsed value"""
+        if not timestamp:
+            return "N/A"
+        if dt is None:
+            return timestamp
+        return dt.strftime('%Y-%m-%d %H:%M:%S')
+        
     def calculate_duration(self):
         """Calculate execution duration"""
         if not self.execution.get('end_time'):
             return "In progress"
             
-        try:
-            start = datetime.fromisoformat(self.execution['start_time'])
-            end = datetime.fromisoformat(self.execution['end_time'])
-            duration = end - start
-            
-            total_seconds = int(duration.total_seconds())
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            seconds = total_seconds % 60
-            
-            if hours > 0:
-                return f"{hours}h {minutes}m {seconds}s"
-            elif minutes > 0:
-                return f"{minutes}m {seconds}s"
-            else:
-                return f"{seconds}s"
-        except:
+        if self.start_dt is None or self.end_dt is None:
             return "N/A"
             
+        total_seconds = int((self.end_dt - self.start_dt).total_seconds())
+        hours = total_seconds // 3600
+        minutes = (total_seconds % 3600) // 60
+        seconds = total_seconds % 60
+        
+        if hours > 0:
+            return f"{hours}h {minutes}m {seconds}s"
+        elif minutes > 0:
+            return f"{minutes}m {seconds}s"
+        else:
+            return f"{seconds}s"
+            
     def copy_output(self):
         """Copy output to clipboard"""
-        output = self.output_text.get(1.0, tk.END)
+        # Taken from the execution so a log that is still loading is copied whole
+        output = self.execution.get('output') or self.output_text.get(1.0, tk.END)
         self.dialog.clipboard_clear()
         self.dialog.clipboard_append(output)
         
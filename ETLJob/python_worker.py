@@ -0,0 +1,159 @@
+"""
+Python Worker - Long-lived interpreter that runs Python job scripts on request
+"""
+
+import json
+import os
+import runpy
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import traceback
+
+
+class PersistentPythonWorker:
+    """One worker process; libraries a script imports stay loaded for its later runs"""
+    
+    def __init__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, '-u', os.path.abspath(__file__)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True
+        )
+        self.timed_out = False
+        
+    def alive(self):
+        """Whether the worker process is still running"""
+        return self.process.poll() is None
+        
+    def run(self, script, args, cwd, env, timeout=None, log_path=None, tail_chars=65536):
+        """Run a script in the worker, returns (stdout, stderr, exit_code) with each stream cut to its last tail_chars"""
+        request = json.dumps({'script': script, 'args': args, 'cwd': cwd, 'env': env,
+                              'log': log_path and os.path.abspath(log_path), 'tail': tail_chars})
+        
+        # Kill the worker if the script overruns; the read below then sees end of file
+        timer = None
+        if timeout:
+            timer = threading.Timer(timeout, self._expire)
+            timer.daemon = True
+            timer.start()
+            
+        try:
+            self.process.stdin.write(request + '\n')
+            self.process.stdin.flush()
+            line = self.process.stdout.readline()
+        except OSError:
+            line = ''
+        finally:
+            if timer:
+                timer.cancel()
+                
+        if not line:
+            self.close()
+            if self.timed_out:
+                return "", f"Process timed out after {timeout} seconds\n", 1
+            return "", "Python worker exited before the script finished\n", 1
+            
+        response = json.loads(line)
+        return response['stdout'], response['stderr'], response['exit_code']
+        
+    def _expire(self):
+        """Timer callback for a script that ran past its timeout"""
+        self.timed_out = True
+        self.process.kill()
+        
+    def close(self):
+        """Stop the worker process"""
+        if self.alive():
+            self.process.kill()
+        self.process.wait()
+
+
+def _read_tail(stream, limit, log_path):
+    """Decode the last limit bytes of a capture file, noting where earlier output was cut off"""
+    size = stream.seek(0, os.SEEK_END)
+    stream.seek(max(0, size - limit))
+    text = stream.read().decode('utf-8', errors='replace')
+    if size > limit:
+        where = f", full log: {log_path}" if log_path else ""
+        text = f"[Earlier output truncated{where}]\n" + text
+    return text
+    
+    
+def _run_request(request, base_env):
+    """Run one script with fd-level output capture, returns the response dict"""
+    script = os.path.abspath(os.path.join(request['cwd'], request['script']))
+    script_dir = os.path.dirname(script)
+    
+    # No env means the job adds nothing to the environment the worker started with
+    os.environ.clear()
+    os.environ.update(base_env if request['env'] is None else request['env'])
+    os.chdir(request['cwd'])
+    sys.argv = [script] + request['args']
+    sys.path.insert(0, script_dir)
+    loaded = set(sys.modules)
+    
+    # Capture at the descriptor level so child processes' output is kept too
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        
+        exit_code = 0
+        try:
+            runpy.run_path(script, run_name='__main__')
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                exit_code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except BaseException:
+            traceback.print_exc()
+            exit_code = 1
+            
+        sys.stdout.flush()
+        sys.stderr.flush()
+        
+        # The full output goes to the execution's log, only the tails back to the scheduler
+        if request['log']:
+            with open(request['log'], 'ab') as log:
+                for stream in (out, err):
+                    stream.seek(0)
+                    shutil.copyfileobj(stream, log)
+                    
+        response = {'stdout': _read_tail(out, request['tail'], request['log']),
+                    'stderr': _read_tail(err, request['tail'], request['log']),
+                    'exit_code': exit_code}
+        
+    # Forget the job's own modules so edits to them are picked up on the next run,
+    # while installed libraries stay imported
+    for name in set(sys.modules) - loaded:
+        path = getattr(sys.modules[name], '__file__', None) or ''
+        if path.startswith(script_dir):
+            del sys.modules[name]
+    sys.path.remove(script_dir)
+    
+    return response
+
+
+def _serve():
+    """Worker main loop: one JSON request per stdin line, one JSON response per line"""
+    # Requests and responses use private copies of stdin/stdout, so scripts reading
+    # stdin get end of file and their output never reaches the protocol pipe
+    requests = os.fdopen(os.dup(0), 'r')
+    responses = os.fdopen(os.dup(1), 'w')
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    base_env = dict(os.environ)
+    
+    for line in requests:
+        response = _run_request(json.loads(line), base_env)
+        responses.write(json.dumps(response) + '\n')
+        responses.flush()
+
+
+if __name__ == '__main__':
+    _serve()
@@ -2,136 +2,478 @@
 Scheduler Engine - Handles job scheduling and execution
 """
 
-import subprocess
 import threading
+import asyncio
+import codecs
+import concurrent.futures
+import heapq
 import time
 import schedule
+from collections import deque
 from datetime import datetime, timedelta
 from croniter import croniter
 import json
 import os
+import re
+import shlex
+import shutil
+import sys
+import logging
+import logging.handlers
+import queue
+from python_worker import PersistentPythonWorker
+
+
+# Job output is read in chunks of at most this many bytes; only the last OUTPUT_TAIL_CHARS
+# of each stream are kept in memory, the full output goes to a log file per execution
+_READ_CHARS = 65536
+OUTPUT_TAIL_CHARS = 65536
+
+# Characters that never mean anything to a shell (shlex.quote's safe set plus spaces and tabs);
+# single-line shell jobs made only of these run their program directly instead of through
+# the shell. Newlines are left out: the shell runs each line as its own command
+_PLAIN_COMMAND = re.compile(r'[\w@+=:,./ \t-]*', re.ASCII)
+
+# Notification email text; only the last NOTIFY_OUTPUT_CHARS of each output stream are included
+NOTIFY_SUBJECT = "Job {name} {status}"
+NOTIFY_TEMPLATE = """
+Job: {name}
+Status: {status}
+Time: {time}
+
+Output:
+{output}
+
+Error Output:
+{error_output}
+"""
+NOTIFY_OUTPUT_CHARS = 4096
+
+# Scheduler and worker threads only put records on this queue; a listener thread
+# started with the scheduler writes them out
+logger = logging.getLogger("etl.scheduler")
+logger.propagate = False
+_log_queue = queue.Queue(-1)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+
+def lower_thread_priority():
+    """Move the calling thread to the batch scheduling class where the OS has one"""
+    # Linux applies this per thread and job processes started from the thread inherit it,
+    # so scheduler work yields to the UI thread when many jobs run at once
+    try:
+        os.sched_setscheduler(0, os.SCHED_BATCH, os.sched_param(0))
+    except (AttributeError, OSError):
+        pass
+
+
+def _watch_children_with_pidfds(loop):
+    """Have loop reap job processes through pidfds instead of a waitpid thread per child"""
+    # Python 3.12+ already does this by default; the kernel needs pidfd_open (Linux 5.3)
+    if sys.version_info >= (3, 12) or not hasattr(os, 'pidfd_open'):
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return
+    watcher = asyncio.PidfdChildWatcher()
+    watcher.attach_loop(loop)
+    asyncio.set_child_watcher(watcher)
+
+
+def _is_own_python(path):
+    """Whether the interpreter at path is the one running the scheduler, virtualenv included"""
+    # A virtualenv's python links to the base interpreter but gets its own site-packages
+    # from its location, so the directory has to match as well as the file
+    if not path:
+        return False
+    try:
+        return os.path.dirname(os.path.abspath(path)) == os.path.dirname(sys.executable) and \
+            os.path.samefile(path, sys.executable)
+    except OSError:
+        return False
 
 
 class SchedulerEngine:
     """Manages job scheduling and execution"""
     
+    # Seconds between trims of the execution history
+    PRUNE_INTERVAL = 3600
+    
+    # Longest the loop sleeps between checks when nothing wakes it earlier
+    CHECK_INTERVAL = 30
+    
+    # Seconds between full reloads of the schedule, to pick up changes made outside the UI
+    RESYNC_INTERVAL = 600
+    
+    # Worker count when settings.json doesn't set max_concurrent_jobs
+    DEFAULT_MAX_CONCURRENT = 5
+    
+    # Directory for the full output of each execution
+    LOG_DIR = "logs"
+    
     def __init__(self, job_manager, status_callback=None):
         self.job_manager = job_manager
         self.status_callback = status_callback
         self.running = False
         self.scheduler_thread = None
-        self.running_jobs = {}
+        
+        # IDs of jobs claimed by a queued or running execution; _claim() is the only
+        # way in, so a job can't be dispatched twice
+        self.running_jobs = set()
         self.lock = threading.Lock()
         
+        # Scheduled runs go through a pool capped at the configured concurrency
+        settings = self._load_settings()
+        self.max_concurrent_jobs = self._setting(settings, 'scheduler', 'max_concurrent_jobs',
+                                                 self.DEFAULT_MAX_CONCURRENT, lambda value: max(1, int(value)))
+        self._pool = None
+        
+        # Log destination and level from the logging settings
+        self.log_file = self._setting(settings, 'logging', 'log_file', 'etl_scheduler.log', str)
+        self.log_level = self._setting(settings, 'logging', 'log_level', logging.INFO, logging.getLevelName)
+        self.max_log_bytes = self._setting(settings, 'logging', 'max_log_size_mb', 100, int) * 1024 * 1024
+        self._log_listener = None
+        
+        # Idle interpreters that run Python jobs, reused so libraries are imported once
+        self._python_workers = []
+        
+        # Event loop that reads the output of all other job processes; see _io_loop()
+        self._loop = None
+        
+        # Wakes the loop early when jobs change, finish or are stopped
+        self._cv = threading.Condition()
+        self._wake = False
+        
+        # Parsed cron schedules per job, as {job_id: (expression, croniter)}
+        self._cron_cache = {}
+        
+        # Parsed environment variables per job, as {job_id: (environment_vars, dict)}
+        self._env_cache = {}
+        
+        # Enabled scheduled jobs, a min-heap of (due epoch, job ID) and each job's current
+        # due time; heap entries that no longer match _due are stale and skipped
+        self._jobs = {}
+        self._heap = []
+        self._due = {}
+        self._reload = True
+        self._loaded_at = 0
+        
+        # Jobs whose most recent execution completed, read with the schedule and kept
+        # current by execute_job(); a job's dependencies are met when all are in it
+        self._completed = set()
+        
+        # Dependency index precomputed by the UI whenever the job set changes
+        self.dep_graph = {}
+        self.transitive_deps = {}
+        self.downstream_count = {}
+        self.last_prune = None
+        
     def start(self):
         """Start the scheduler"""
         self.running = True
-        self.scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
+        if self._log_listener is None:
+            self._start_logging()
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrent_jobs,
+                                                           thread_name_prefix='etl-scheduled',
+                                                           initializer=lower_thread_priority)
+        self.scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True, name='etl-scheduler')
         self.scheduler_thread.start()
         
     def stop(self):
         """Stop the scheduler"""
         self.running = False
+        self.notify()
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=2)
+        if self._pool:
+            # Drop runs still waiting for a worker; running ones finish on their own
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            
+        with self.lock:
+            workers, self._python_workers = self._python_workers, []
+        for worker in workers:
+            worker.close()
+            
+        # Write out what is still queued and close the log file
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
+            
+    def _load_settings(self, settings_file="settings.json"):
+        """Read the settings file, or an empty dict if it is missing or unreadable"""
+        try:
+            with open(settings_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+            
+    def _setting(self, settings, section, key, default, convert):
+        """One converted setting, falling back to default when it is missing or invalid"""
+        try:
+            return convert(settings[section][key])
+        except (KeyError, TypeError, ValueError):
+            return default
+            
+    def _start_logging(self):
+        """Start the thread that writes queued log records to the console and a rotating log file"""
+        # The console handler (stderr) is always present, so it carries the log alone
+        # when the file can't be opened
+        handlers = [logging.StreamHandler(sys.stderr)]
+        file_error = None
+        try:
+            handlers.append(logging.handlers.RotatingFileHandler(
+                self.log_file, maxBytes=self.max_log_bytes, backupCount=3))
+        except OSError as e:
+            file_error = e
+            
+        formatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s')
+        for handler in handlers:
+            handler.setFormatter(formatter)
+            
+        # getLevelName() maps unknown names to a string rather than failing
+        logger.setLevel(self.log_level if isinstance(self.log_level, int) else logging.INFO)
+        self._log_listener = logging.handlers.QueueListener(_log_queue, *handlers)
+        self._log_listener.start()
+        
+        if file_error:
+            logger.error(f"Cannot open log file {self.log_file}, logging to the console only: {file_error}")
+            
+    def set_dep_index(self, dep_graph, transitive_deps, downstream_count):
+        """Install a precomputed dependency graph, its closure and downstream counts"""
+        self.dep_graph = dep_graph
+        self.transitive_deps = transitive_deps
+        self.downstream_count = downstream_count
+        
+        # The job set changed, so reload the schedule now rather than at the next tick
+        self.reload_jobs()
+        
+    def reload_jobs(self):
+        """Rebuild the schedule from the database on the loop's next pass, which starts now"""
+        self._reload = True
+        self.notify()
+        
+    def notify(self):
+        """Wake the scheduler loop for an immediate check"""
+        with self._cv:
+            self._wake = True
+            self._cv.notify()
             
     def _scheduler_loop(self):
         """Main scheduler loop"""
+        lower_thread_priority()
         while self.running:
+            next_due = None
             try:
-                # Check all enabled jobs
-                jobs = self.job_manager.get_enabled_jobs()
-                
-                for job in jobs:
-                    # Skip if already running
-                    if job['id'] in self.running_jobs:
-                        continue
-                        
-                    # Check if job should run
-                    should_run = False
+                # Read the clock once per pass; every job evaluated in it uses the same time
+                now = datetime.now()
+                now_epoch = now.timestamp()
+                if self._reload or now_epoch - self._loaded_at >= self.RESYNC_INTERVAL:
+                    self._load_schedule(now)
                     
-                    if job['schedule_type'] == 'interval' and job.get('interval_minutes'):
-                        # Check interval-based scheduling
-                        last_run = job.get('last_run')
-                        if not last_run:
-                            should_run = True
+                # Pop only the jobs that are due; stale entries left by rescheduling are skipped
+                due = []
+                while self._heap and self._heap[0][0] <= now_epoch:
+                    epoch, job_id = heapq.heappop(self._heap)
+                    if self._due.get(job_id) == epoch:
+                        due.append(self._jobs[job_id])
+                        
+                # Trigger jobs that unblock the most downstream work first
+                downstream_count = self.downstream_count
+                due.sort(key=lambda job: downstream_count.get(job['id'], 0), reverse=True)
+                
+                # Next run times computed this pass, written together once it ends
+                next_runs = {}
+                
+                for job in due:
+                    # Claim the job before anything else so one already queued or running is skipped
+                    if self._claim(job['id']):
+                        # Check dependencies against the jobs whose latest run completed,
+                        # querying only for jobs the index doesn't know yet
+                        deps = self.dep_graph.get(job['id'])
+                        if deps is not None:
+                            deps_met = deps <= self._completed
                         else:
-                            try:
-                                last_run_dt = datetime.fromisoformat(last_run)
-                                next_run = last_run_dt + timedelta(minutes=job['interval_minutes'])
-                                if datetime.now() >= next_run:
-                                    should_run = True
-                                else:
-                                    # Update next run time if not set
-                                    if not job.get('next_run'):
-                                        self.job_manager.update_job_next_run(job['id'], next_run.isoformat())
-                            except:
-                                should_run = True
-                                
-                    elif job['schedule_type'] == 'cron' and job.get('cron_expression'):
-                        # Check cron-based scheduling
-                        try:
-                            cron = croniter(job['cron_expression'], datetime.now())
-                            next_run = cron.get_next(datetime)
+                            deps_met = self.job_manager.check_dependencies_met(job['id'])
                             
-                            # Check if it's time to run (within last minute)
-                            last_run = job.get('last_run')
-                            if not last_run:
-                                should_run = True
-                            else:
-                                last_run_dt = datetime.fromisoformat(last_run)
-                                if next_run <= datetime.now() and (datetime.now() - last_run_dt).total_seconds() > 60:
-                                    should_run = True
-                                    
-                            # Update next run time
-                            if not should_run:
-                                self.job_manager.update_job_next_run(job['id'], next_run.isoformat())
-                        except Exception as e:
-                            print(f"Error parsing cron expression for job {job['name']}: {e}")
+                        if deps_met:
+                            # Run job on the worker pool, releasing the claim if it is cancelled
+                            future = self._pool.submit(self.execute_job, job['id'], claimed=True)
+                            future.add_done_callback(
+                                lambda f, job_id=job['id']: f.cancelled() and self._release(job_id))
                             
-                    if should_run:
-                        # Check dependencies before running
-                        if self.job_manager.check_dependencies_met(job['id']):
-                            # Run job in separate thread
-                            thread = threading.Thread(
-                                target=self.execute_job, 
-                                args=(job['id'],), 
-                                daemon=True
-                            )
-                            thread.start()
-                        else:
-                            print(f"Dependencies not met for job {job['name']}")
+                            # Compute the following run once, now that this one is dispatched
+                            next_run = self._following_run(job, now)
+                            if next_run is not None:
+                                next_runs[job['id']] = next_run.isoformat()
+                                self._push(job['id'], next_run.timestamp())
+                            continue
                             
+                        self._release(job['id'])
+                        logger.info(f"Dependencies not met for job {job['name']}")
+                        
+                    # Still running or blocked, so look again after the check interval
+                    self._push(job['id'], now_epoch + self.CHECK_INTERVAL)
+                    
+                if next_runs:
+                    self.job_manager.update_next_runs_bulk(next_runs)
+                    
+                # Keep the execution history bounded
+                elapsed = time.monotonic()
+                if self.last_prune is None or elapsed - self.last_prune >= self.PRUNE_INTERVAL:
+                    self.last_prune = elapsed
+                    pruned = self.job_manager.prune_executions()
+                    if pruned:
+                        logger.info(f"Pruned {pruned} old executions")
+                        
+                if self._heap:
+                    next_due = self._heap[0][0]
+                    
             except Exception as e:
-                print(f"Scheduler loop error: {e}")
+                logger.exception(f"Scheduler loop error: {e}")
+                
+            # Sleep until the next run is due, a notify() or the check interval, whichever is first
+            timeout = self.CHECK_INTERVAL
+            if next_due is not None:
+                timeout = max(0.1, min(timeout, next_due - time.time()))
+            with self._cv:
+                if not self._wake:
+                    self._cv.wait(timeout)
+                self._wake = False
+                
+    def _load_schedule(self, now):
+        """Read all enabled jobs and rebuild the due-time heap from them as of now"""
+        self._reload = False
+        self._loaded_at = now.timestamp()
+        self._completed = self.job_manager.get_completed_job_ids()
+        
+        jobs = {}
+        due = {}
+        next_runs = {}
+        for job in self.job_manager.get_schedulable_jobs():
+            epoch = job['next_run_epoch']
+            if epoch is None:
+                epoch = self._first_run(job, next_runs, now)
+            if epoch is not None:
+                jobs[job['id']] = job
+                due[job['id']] = epoch
                 
-            # Sleep for a bit before next check
-            time.sleep(30)
+        heap = [(epoch, job_id) for job_id, epoch in due.items()]
+        heapq.heapify(heap)
+        self._jobs, self._due, self._heap = jobs, due, heap
+        
+        if next_runs:
+            self.job_manager.update_next_runs_bulk(next_runs)
             
-    def execute_job(self, job_id, triggered_by='scheduler'):
-        """Execute a job"""
+        # Forget parsed schedules of jobs that were deleted or disabled
+        self._cron_cache = {job_id: entry for job_id, entry in self._cron_cache.items() if job_id in jobs}
+        
+    def _first_run(self, job, next_runs, now):
+        """Due time (epoch seconds) of a job with none stored, or None if it isn't scheduled"""
+        now_epoch = now.timestamp()
+        
+        if job['schedule_type'] == 'interval' and job['interval_minutes']:
+            # Check interval-based scheduling
+            last_run = job['last_run']
+            if not last_run:
+                return now_epoch
+            try:
+                last_run_dt = datetime.fromisoformat(last_run)
+                next_run = last_run_dt + timedelta(minutes=job['interval_minutes'])
+            except (ValueError, TypeError) as e:
+                # Leave the job unscheduled rather than running it on every load
+                logger.warning(f"Bad last run time for job {job['name']}: {e}")
+                return None
+                
+        elif job['schedule_type'] == 'cron' and job['cron_expression']:
+            # Check cron-based scheduling; a job that has never run waits for its next
+            # slot, the same as one saved from the job dialog
+            try:
+                cron = self._get_cron(job['id'], job['cron_expression'], now)
+            except ValueError as e:
+                logger.error(f"Error parsing cron expression for job {job['name']}: {e}")
+                return None
+            next_run = cron.get_next(datetime)
+            
+        else:
+            return None
+            
+        # Store the due time so later loads skip the parsing
+        if next_run.timestamp() > now_epoch:
+            next_runs[job['id']] = next_run.isoformat()
+        return next_run.timestamp()
+        
+    def _push(self, job_id, epoch):
+        """Schedule job_id's next check at epoch, superseding any earlier heap entry"""
+        self._due[job_id] = epoch
+        heapq.heappush(self._heap, (epoch, job_id))
+        
+    def _get_cron(self, job_id, expression, now):
+        """Get the job's croniter positioned at now, parsing the expression only when it changes"""
+        cached = self._cron_cache.get(job_id)
+        if cached and cached[0] == expression:
+            cron = cached[1]
+            cron.set_current(now, force=True)
+        else:
+            cron = croniter(expression, now)
+            self._cron_cache[job_id] = (expression, cron)
+        return cron
+        
+    def _following_run(self, job, now):
+        """Next run time after one dispatched at now, or None if it can't be computed"""
+        try:
+            if job['schedule_type'] == 'interval':
+                return now + timedelta(minutes=job['interval_minutes'])
+            return self._get_cron(job['id'], job['cron_expression'], now).get_next(datetime)
+        except (ValueError, TypeError) as e:
+            logger.error(f"Error computing next run for job {job['name']}: {e}")
+            return None
+            
+    def _claim(self, job_id, upstream=None):
+        """Reserve job_id for one execution; False if it is already claimed or an upstream job is running"""
         with self.lock:
             if job_id in self.running_jobs:
-                print(f"Job {job_id} is already running")
-                return
-            self.running_jobs[job_id] = True
+                return False
+            # Don't start while any job it transitively depends on is mid-run
+            if upstream and not upstream.isdisjoint(self.running_jobs):
+                return False
+            self.running_jobs.add(job_id)
+            return True
+            
+    def _release(self, job_id):
+        """Drop the claim on job_id"""
+        with self.lock:
+            self.running_jobs.discard(job_id)
+            
+    def execute_job(self, job_id, triggered_by='scheduler', upstream=None, claimed=False):
+        """Execute a job; claimed is set by the scheduler, which reserves the job before dispatching it"""
+        if not claimed and not self._claim(job_id, upstream):
+            logger.info(f"Job {job_id} is already running or has upstream jobs still running")
+            return
             
         try:
             job = self.job_manager.get_job(job_id)
             if not job:
                 return
                 
-            # Create execution record
-            execution_id = self.job_manager.create_execution(job_id, triggered_by)
-            
-            # Update job status
-            self.job_manager.update_job_status(job_id, 'status', 'running')
-            self.job_manager.update_job_last_run(job_id)
+            # Create execution record, updating job status and last run time with it
+            execution_id = self.job_manager.start_execution(job_id, triggered_by)
+            self._completed.discard(job_id)
             
             # Notify UI
             if self.status_callback:
                 self.status_callback(job_id, 'running')
             
+            # Full output of every attempt is appended here; without a log directory
+            # the job still runs and only the output tails are kept
+            try:
+                os.makedirs(self.LOG_DIR, exist_ok=True)
+                log_path = os.path.join(self.LOG_DIR, f"job_{job_id}_{execution_id}.log")
+            except OSError as e:
+                logger.warning(f"Not logging output of job {job['name']}: {e}")
+                log_path = None
+            
             # Execute with retries
             retry_count = 0
             max_retries = job.get('max_retries', 0)
@@ -144,16 +486,16 @@ class SchedulerEngine:
                 try:
                     if retry_count > 0:
                         delay = job.get('retry_delay_seconds', 60)
-                        print(f"Retrying job {job['name']} in {delay} seconds (attempt {retry_count + 1}/{max_retries + 1})")
+                        logger.warning(f"Retrying job {job['name']} in {delay} seconds (attempt {retry_count + 1}/{max_retries + 1})")
                         time.sleep(delay)
                         
                     # Execute based on job type
                     if job['job_type'] == 'python':
-                        output, error_output, exit_code = self._execute_python(job)
+                        output, error_output, exit_code = self._execute_python(job, log_path)
                     elif job['job_type'] == 'shell':
-                        output, error_output, exit_code = self._execute_shell(job)
+                        output, error_output, exit_code = self._execute_shell(job, log_path)
                     elif job['job_type'] == 'sql':
-                        output, error_output, exit_code = self._execute_sql(job)
+                        output, error_output, exit_code = self._execute_sql(job, log_path)
                     else:
                         error_output = f"Unknown job type: {job['job_type']}"
                         exit_code = 1
@@ -168,12 +510,13 @@ class SchedulerEngine:
                     exit_code = 1
                     retry_count += 1
                     
-            # Update execution record
+            # Update execution record and job status together
             end_time = datetime.now().isoformat()
             status = 'completed' if success else 'failed'
             
-            self.job_manager.update_execution(
+            self.job_manager.finish_execution(
                 execution_id,
+                job_id,
                 end_time=end_time,
                 status=status,
                 exit_code=exit_code,
@@ -181,9 +524,8 @@ class SchedulerEngine:
                 error_output=error_output,
                 retry_count=retry_count - 1 if retry_count > 0 else 0
             )
-            
-            # Update job status
-            self.job_manager.update_job_status(job_id, 'status', status)
+            if success:
+                self._completed.add(job_id)
             
             # Send notifications if configured
             if job.get('notification_email'):
@@ -200,107 +542,204 @@ class SchedulerEngine:
                 self.status_callback(job_id, status, combined_output)
                 
         except Exception as e:
-            print(f"Error executing job {job_id}: {e}")
+            logger.error(f"Error executing job {job_id}: {e}")
         finally:
-            with self.lock:
-                self.running_jobs.pop(job_id, None)
+            self._release(job_id)
+            # Let jobs waiting on this one be checked right away
+            self.notify()
                 
-    def _execute_python(self, job):
+    def _job_env(self, job):
+        """Environment for a job run, parsing the job's variables only when they change"""
+        text = job.get('environment_vars')
+        cached = self._env_cache.get(job['id'])
+        if cached is None or cached[0] != text:
+            custom_env = {}
+            if text:
+                try:
+                    custom_env = json.loads(text)
+                except ValueError as e:
+                    logger.warning(f"Ignoring invalid environment variables for job {job['name']}: {e}")
+                if not isinstance(custom_env, dict):
+                    logger.warning(f"Ignoring environment variables for job {job['name']}: expected a JSON object")
+                    custom_env = {}
+            cached = self._env_cache[job['id']] = (text, custom_env)
+            
+        # None lets the process inherit ours without building a copy
+        if not cached[1]:
+            return None
+        env = os.environ.copy()
+        env.update(cached[1])
+        return env
+        
+    def _execute_python(self, job, log_path=None):
         """Execute a Python script"""
         # Prepare environment
-        env = os.environ.copy()
-        if job.get('environment_vars'):
-            try:
-                custom_env = json.loads(job['environment_vars'])
-                env.update(custom_env)
-            except:
-                pass
-                
+        env = self._job_env(job)
+        
         # Set working directory
         cwd = job.get('working_directory') or os.getcwd()
         
         # Get timeout
         timeout = job.get('timeout_seconds')
         
+        # Scripts run in a persistent worker when the job's python3 is our own interpreter;
+        # anything else (flags, -m, missing files, another python3 on the job's PATH) gets its own
+        args = shlex.split(job['command'])
+        if args and args[0].endswith('.py') and os.path.isfile(os.path.join(cwd, args[0])) and \
+                _is_own_python(shutil.which('python3', path=(env or os.environ).get('PATH'))):
+            return self._execute_python_worker(args, cwd, env, timeout, log_path)
+            
         # Execute
-        command = ['python3'] + job['command'].split()
+        command = ['python3'] + args
         
-        process = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=cwd,
-            env=env,
-            text=True
-        )
+        return self._run_process(command, False, cwd, env, timeout, log_path)
         
-        try:
-            stdout, stderr = process.communicate(timeout=timeout)
-            return stdout, stderr, process.returncode
-        except subprocess.TimeoutExpired:
-            process.kill()
-            stdout, stderr = process.communicate()
-            return stdout, f"Process timed out after {timeout} seconds\n" + stderr, 1
+    def _execute_python_worker(self, args, cwd, env, timeout, log_path=None):
+        """Run a Python script on an idle persistent worker, starting one if none is free"""
+        with self.lock:
+            worker = self._python_workers.pop() if self._python_workers else None
+        if worker is None or not worker.alive():
+            worker = PersistentPythonWorker()
             
-    def _execute_shell(self, job):
+        result = worker.run(args[0], args[1:], cwd, env, timeout, log_path, OUTPUT_TAIL_CHARS)
+        
+        if worker.alive():
+            with self.lock:
+                self._python_workers.append(worker)
+        return result
+        
+    def _execute_shell(self, job, log_path=None):
         """Execute a shell command"""
         # Prepare environment
-        env = os.environ.copy()
-        if job.get('environment_vars'):
-            try:
-                custom_env = json.loads(job['environment_vars'])
-                env.update(custom_env)
-            except:
-                pass
-                
+        env = self._job_env(job)
+        
         # Set working directory
         cwd = job.get('working_directory') or os.getcwd()
         
         # Get timeout
         timeout = job.get('timeout_seconds')
         
+        # Plain commands naming a program on PATH skip the shell; anything using shell
+        # syntax, builtins or relative paths still goes through it
+        command = job['command']
+        shell = True
+        if _PLAIN_COMMAND.fullmatch(command.strip()):
+            args = shlex.split(command)
+            if args and os.path.basename(args[0]) == args[0] and \
+                    shutil.which(args[0], path=(env or os.environ).get('PATH')):
+                command, shell = args, False
+                
         # Execute
-        process = subprocess.Popen(
-            job['command'],
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=cwd,
-            env=env,
-            text=True
-        )
+        return self._run_process(command, shell, cwd, env, timeout, log_path)
         
+    def _io_loop(self):
+        """Event loop that reads every running job's output on one thread, started on first use"""
+        with self.lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                _watch_children_with_pidfds(self._loop)
+                self._loop.call_soon(lower_thread_priority)
+                threading.Thread(target=self._loop.run_forever, daemon=True, name='etl-job-io').start()
+            return self._loop
+            
+    def _run_process(self, command, shell, cwd, env, timeout, log_path=None):
+        """Run a process on the I/O loop and wait for its (stdout, stderr, exit_code)"""
+        coroutine = self._run_process_async(command, shell, cwd, env, timeout, log_path)
+        return asyncio.run_coroutine_threadsafe(coroutine, self._io_loop()).result()
+        
+    async def _run_process_async(self, command, shell, cwd, env, timeout, log_path):
+        """Start a process and read its output as it arrives, keeping only the tail of each stream in memory"""
+        # Opened before spawning, so a bad log path fails without leaving a child
+        # behind. Raw bytes are appended, so the locale encoding never matters
+        log = open(log_path, 'ab') if log_path else None
         try:
-            stdout, stderr = process.communicate(timeout=timeout)
-            return stdout, stderr, process.returncode
-        except subprocess.TimeoutExpired:
-            process.kill()
-            stdout, stderr = process.communicate()
-            return stdout, f"Process timed out after {timeout} seconds\n" + stderr, 1
+            pipes = dict(stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd, env=env)
+            if shell:
+                process = await asyncio.create_subprocess_shell(command, **pipes)
+            else:
+                process = await asyncio.create_subprocess_exec(*command, **pipes)
+                
+            # Per stream: the newest chunks, still covering at least OUTPUT_TAIL_CHARS, and
+            # whether older ones were dropped. Reads return whatever has arrived, so chunks vary in size
+            tails = [deque(), deque()]
+            dropped = [False, False]
+            # Cleared when a log write fails, so the pipes are still read to the end
+            log_ok = [log is not None]
+            
+            async def drain(stream, index):
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+                tail = tails[index]
+                size = 0
+                while True:
+                    data = await stream.read(_READ_CHARS)
+                    chunk = decoder.decode(data, final=not data)
+                    if chunk:
+                        tail.append(chunk)
+                        size += len(chunk)
+                        while size - len(tail[0]) >= OUTPUT_TAIL_CHARS:
+                            size -= len(tail.popleft())
+                            dropped[index] = True
+                    if data and log_ok[0]:
+                        try:
+                            log.write(data)
+                        except OSError as e:
+                            logger.warning(f"Stopped writing job log {log_path}: {e}")
+                            log_ok[0] = False
+                    if not data:
+                        break
+                        
+            # Both pipes are read concurrently, so neither can fill up and stall the process
+            readers = asyncio.gather(drain(process.stdout, 0), drain(process.stderr, 1))
             
-    def _execute_sql(self, job):
+            timed_out = False
+            try:
+                await asyncio.wait_for(process.wait(), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                timed_out = True
+                
+            await readers
+        finally:
+            if log:
+                log.close()
+                
+        stdout, stderr = [self._tail_text(tails[index], dropped[index], log_path) for index in (0, 1)]
+        
+        if timed_out:
+            return stdout, f"Process timed out after {timeout} seconds\n" + stderr, 1
+        return stdout, stderr, process.returncode
+        
+    def _tail_text(self, chunks, dropped, log_path):
+        """Join a stream's kept chunks, noting where earlier output was cut off"""
+        text = ''.join(chunks)
+        if len(text) > OUTPUT_TAIL_CHARS:
+            text = text[-OUTPUT_TAIL_CHARS:]
+            dropped = True
+        if dropped:
+            where = f", full log: {log_path}" if log_path else ""
+            text = f"[Earlier output truncated{where}]\n" + text
+        return text
+        
+    def _execute_sql(self, job, log_path=None):
         """Execute SQL query"""
         # This is a placeholder - actual implementation would connect to a database
         # For now, we'll just execute it as a shell command assuming it's using psql, mysql, etc.
-        return self._execute_shell(job)
+        return self._execute_shell(job, log_path)
         
     def _send_notification(self, job, success, output, error_output):
         """Send email notification"""
         # Placeholder for email notification
         # In a real implementation, this would use smtplib to send emails
         status = "SUCCESS" if success else "FAILED"
-        subject = f"Job {job['name']} {status}"
+        subject = NOTIFY_SUBJECT.format_map({'name': job['name'], 'status': status})
         
-        body = f"""
-Job: {job['name']}
-Status: {status}
-Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-Output:
-{output}
-
-Error Output:
-{error_output}
-"""
+        body = NOTIFY_TEMPLATE.format_map({
+            'name': job['name'],
+            'status': status,
+            'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'output': output[-NOTIFY_OUTPUT_CHARS:],
+            'error_output': error_output[-NOTIFY_OUTPUT_CHARS:],
+        })
         
-        print(f"Would send email to {job['notification_email']}: {subject}")
\ No newline at end of file
+        logger.info(f"Would send email to {job['notification_email']}: {subject}")
\ No newline at end of file
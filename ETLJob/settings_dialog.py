@@ -6,8 +6,75 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import json
 import os
+import copy
+import queue
+import threading
 
 
+# Settings are written by one background thread; saves queued while it is busy
+# are collapsed so only the newest settings for each file get written
+_save_queue = queue.Queue()
+_save_thread = None
+_save_thread_lock = threading.Lock()
+
+
+def _is_int_text(text):
+    """Key validator for numeric entries: accept only an empty field or digits"""
+    return text == '' or text.isdigit()
+    
+    
+def _int_or(var, default):
+    """Read an integer entry, falling back to default for empty or malformed text"""
+    try:
+        return int(var.get())
+    except ValueError:
+        return default
+    
+    
+def _write_settings(path, settings):
+    """Write settings to a synced temporary file, then rename it over path"""
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(settings, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    
+    
+def _save_worker():
+    """Drain the save queue, writing each file once per batch"""
+    while True:
+        batch = [_save_queue.get()]
+        while not _save_queue.empty():
+            batch.append(_save_queue.get_nowait())
+            
+        latest = {path: settings for path, settings, result in batch}
+        errors = {}
+        for path, settings in latest.items():
+            try:
+                _write_settings(path, settings)
+                errors[path] = None
+            except Exception as e:
+                errors[path] = e
+                
+        for path, settings, result in batch:
+            result['error'] = errors[path]
+            result['done'] = True
+            
+            
+def _queue_save(path, settings):
+    """Queue a snapshot of settings for writing, returns the result dict the writer fills in"""
+    global _save_thread
+    with _save_thread_lock:
+        if _save_thread is None:
+            _save_thread = threading.Thread(target=_save_worker, daemon=True, name='settings-writer')
+            _save_thread.start()
+            
+    result = {'done': False, 'error': None}
+    _save_queue.put((path, copy.deepcopy(settings), result))
+    return result
+    
+    
 class SettingsDialog:
     """Dialog for application settings"""
     
@@ -24,6 +91,9 @@ class SettingsDialog:
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
+        # Numeric fields only ever hold digits, so save() can convert them directly
+        self._int_vcmd = (self.dialog.register(_is_int_text), '%P')
+        
         self.setup_ui()
         
     def load_settings(self):
@@ -32,8 +102,10 @@ class SettingsDialog:
             try:
                 with open(self.settings_file, 'r') as f:
                     return json.load(f)
-            except:
-                pass
+            except (OSError, ValueError) as e:
+                messagebox.showwarning("Settings",
+                                       f"Could not read {self.settings_file}, using default settings:\n{e}",
+                                       parent=self.parent)
         return self.get_default_settings()
         
     def get_default_settings(self):
@@ -62,15 +134,20 @@ class SettingsDialog:
             }
         }
         
-    def save_settings(self):
-        """Save settings to file"""
-        try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
-            return True
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save settings:\n{str(e)}")
-            return False
+    def save_settings(self, on_saved=None):
+        """Save settings to file in the background; on_saved runs on the Tk thread once written"""
+        result = _queue_save(self.settings_file, self.settings)
+        self._poll_save(result, on_saved)
+        
+    def _poll_save(self, result, on_saved):
+        """Check from the Tk event loop whether a queued save has finished"""
+        # Polled through the parent, which outlives the dialog if it is closed meanwhile
+        if not result['done']:
+            self.parent.after(50, self._poll_save, result, on_saved)
+        elif result['error'] is not None:
+            messagebox.showerror("Error", f"Failed to save settings:\n{str(result['error'])}")
+        elif on_saved:
+            on_saved()
             
     def setup_ui(self):
         """Setup settings UI"""
@@ -125,7 +202,8 @@ class SettingsDialog:
         # SMTP Port
         ttk.Label(container, text="SMTP Port:").grid(row=2, column=0, sticky=tk.W, pady=5)
         self.smtp_port_var = tk.StringVar(value=str(self.settings['smtp']['port']))
-        ttk.Entry(container, textvariable=self.smtp_port_var, width=40).grid(row=2, column=1, sticky=tk.EW, pady=5)
+        ttk.Entry(container, textvariable=self.smtp_port_var, width=40, 
+                 validate='key', validatecommand=self._int_vcmd).grid(row=2, column=1, sticky=tk.EW, pady=5)
         
         # Username
         ttk.Label(container, text="Username:").grid(row=3, column=0, sticky=tk.W, pady=5)
@@ -212,7 +290,7 @@ https://hooks.slack.com/services/T00000000/B00000000/XXXXXXXXXXXX
         self.check_interval_var = tk.StringVar(
             value=str(self.settings['scheduler']['check_interval_seconds']))
         ttk.Spinbox(container, from_=10, to=300, textvariable=self.check_interval_var, 
-                   width=20).grid(row=1, column=1, sticky=tk.W, pady=5)
+                   width=20, validate='key', validatecommand=self._int_vcmd).grid(row=1, column=1, sticky=tk.W, pady=5)
         
         ttk.Label(container, text="How often the scheduler checks for jobs to run", 
                  font=("Arial", 8), foreground="gray").grid(row=2, column=1, sticky=tk.W)
@@ -222,7 +300,7 @@ https://hooks.slack.com/services/T00000000/B00000000/XXXXXXXXXXXX
         self.max_concurrent_var = tk.StringVar(
             value=str(self.settings['scheduler']['max_concurrent_jobs']))
         ttk.Spinbox(container, from_=1, to=20, textvariable=self.max_concurrent_var, 
-                   width=20).grid(row=3, column=1, sticky=tk.W, pady=5)
+                   width=20, validate='key', validatecommand=self._int_vcmd).grid(row=3, column=1, sticky=tk.W, pady=5)
         
         ttk.Label(container, text="Maximum number of jobs that can run simultaneously", 
                  font=("Arial", 8), foreground="gray").grid(row=4, column=1, sticky=tk.W)
@@ -254,7 +332,8 @@ https://hooks.slack.com/services/T00000000/B00000000/XXXXXXXXXXXX
         ttk.Label(container, text="Max Log Size (MB):").grid(row=3, column=0, sticky=tk.W, pady=(15, 5))
         self.max_log_size_var = tk.StringVar(
             value=str(self.settings['logging']['max_log_size_mb']))
-        ttk.Entry(container, textvariable=self.max_log_size_var, width=20).grid(row=3, column=1, sticky=tk.W, pady=5)
+        ttk.Entry(container, textvariable=self.max_log_size_var, width=20, 
+                 validate='key', validatecommand=self._int_vcmd).grid(row=3, column=1, sticky=tk.W, pady=5)
         
         ttk.Label(container, text="Log files will be rotated when they reach this size", 
                  font=("Arial", 8), foreground="gray").grid(row=4, column=1, sticky=tk.W)
@@ -271,7 +350,7 @@ https://hooks.slack.com/services/T00000000/B00000000/XXXXXXXXXXXX
         """Save settings"""
         # Update settings dict
         self.settings['smtp']['host'] = self.smtp_host_var.get()
-        self.settings['smtp']['port'] = int(self.smtp_port_var.get()) if self.smtp_port_var.get().isdigit() else 587
+        self.settings['smtp']['port'] = _int_or(self.smtp_port_var, 587)
         self.settings['smtp']['username'] = self.smtp_username_var.get()
         self.settings['smtp']['password'] = self.smtp_password_var.get()
         self.settings['smtp']['from_email'] = self.smtp_from_var.get()
@@ -280,17 +359,17 @@ https://hooks.slack.com/services/T00000000/B00000000/XXXXXXXXXXXX
         self.settings['slack']['webhook_url'] = self.slack_webhook_var.get()
         self.settings['slack']['enabled'] = self.slack_enabled_var.get()
         
-        self.settings['scheduler']['check_interval_seconds'] = int(self.check_interval_var.get()) \
-            if self.check_interval_var.get().isdigit() else 30
-        self.settings['scheduler']['max_concurrent_jobs'] = int(self.max_concurrent_var.get()) \
-            if self.max_concurrent_var.get().isdigit() else 5
+        self.settings['scheduler']['check_interval_seconds'] = _int_or(self.check_interval_var, 30)
+        self.settings['scheduler']['max_concurrent_jobs'] = _int_or(self.max_concurrent_var, 5)
         
         self.settings['logging']['log_level'] = self.log_level_var.get()
         self.settings['logging']['log_file'] = self.log_file_var.get()
-        self.settings['logging']['max_log_size_mb'] = int(self.max_log_size_var.get()) \
-            if self.max_log_size_var.get().isdigit() else 100
+        self.settings['logging']['max_log_size_mb'] = _int_or(self.max_log_size_var, 100)
+        
+        self.save_settings(self.on_saved)
         
-        if self.save_settings():
-            messagebox.showinfo("Success", "Settings saved successfully!\n\n"
-                              "Note: Some settings may require restarting the application.")
-            self.dialog.destroy()
\ No newline at end of file
+    def on_saved(self):
+        """Confirm a finished save and close the dialog"""
+        messagebox.showinfo("Success", "Settings saved successfully!\n\n"
+                          "Note: Some settings may require restarting the application.")
+        self.dialog.destroy()
\ No newline at end of file
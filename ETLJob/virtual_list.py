@@ -0,0 +1,235 @@
+"""
+Virtual Job List - Canvas-based job list that only draws the visible rows
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualJobList:
+    """Drop-in replacement for the job Treeview that renders O(visible) rows"""
+    
+    ROW_HEIGHT = 22
+    HEADER_HEIGHT = 24
+    CHAR_WIDTH = 7
+    
+    def __init__(self, parent, columns):
+        self.columns = ("#0",) + tuple(columns)
+        self.headings = {col: "" for col in self.columns}
+        self.heading_commands = {}
+        self.widths = {col: 100 for col in self.columns}
+        
+        # Model: row data per iid, the attached rows in display order and the same rows as a set
+        self.items = {}
+        self.order = []
+        self.attached = set()
+        self.selected = None
+        self.top = 0
+        self.yscrollcommand = None
+        self.redraw_pending = False
+        
+        self.frame = ttk.Frame(parent)
+        
+        self.header = tk.Canvas(self.frame, height=self.HEADER_HEIGHT, highlightthickness=0)
+        self.header.pack(fill=tk.X)
+        
+        self.canvas = tk.Canvas(self.frame, bg="white", highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        
+        self.header.bind("<Button-1>", self.on_header_click)
+        self.canvas.bind("<Button-1>", self.on_click)
+        self.canvas.bind("<Configure>", lambda e: self.schedule_redraw())
+        self.canvas.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.canvas.bind("<Button-4>", lambda e: self.yview("scroll", -3, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.yview("scroll", 3, "units"))
+        
+    def pack(self, **kwargs):
+        """Pack the list's frame"""
+        self.frame.pack(**kwargs)
+        
+    def bind(self, sequence, func):
+        """Bind an event on the row canvas"""
+        self.canvas.bind(sequence, func)
+        
+    def configure(self, yscrollcommand=None):
+        """Set the scrollbar callback"""
+        self.yscrollcommand = yscrollcommand
+        self.schedule_redraw()
+        
+    def heading(self, column, text="", command=None):
+        """Set a column heading and its click command"""
+        self.headings[column] = text
+        if command:
+            self.heading_commands[column] = command
+        self.schedule_redraw()
+        
+    def column(self, column, width=100):
+        """Set a column width"""
+        self.widths[column] = width
+        self.schedule_redraw()
+        
+    def insert(self, parent, index, iid, text="", values=()):
+        """Insert a row at index"""
+        self.items[iid] = (text, tuple(values))
+        self.order.insert(index if index != "end" else len(self.order), iid)
+        self.attached.add(iid)
+        self.schedule_redraw()
+        return iid
+        
+    def item(self, iid, text=None, values=None):
+        """Update a row's icon text and/or values"""
+        old_text, old_values = self.items[iid]
+        self.items[iid] = (old_text if text is None else text,
+                           old_values if values is None else tuple(values))
+        self.schedule_redraw()
+        
+    def delete(self, iid):
+        """Remove a row permanently"""
+        self.detach(iid)
+        del self.items[iid]
+        
+    def detach(self, iid):
+        """Hide a row, keeping its data for reattach"""
+        if iid in self.attached:
+            self.order.remove(iid)
+            self.attached.discard(iid)
+            if self.selected == iid:
+                self.selected = None
+            self.schedule_redraw()
+            
+    def move(self, iid, parent, index):
+        """Move (or reattach) a row to index"""
+        if index < len(self.order) and self.order[index] == iid:
+            return
+        if iid in self.attached:
+            self.order.remove(iid)
+        self.order.insert(index, iid)
+        self.attached.add(iid)
+        self.schedule_redraw()
+        
+    reattach = move
+    
+    def set_children(self, item, *newchildren):
+        """Show exactly newchildren in that order and detach every other row, like Treeview"""
+        # One pass for a whole filter or sort instead of a list search per row
+        self.order = list(newchildren)
+        self.attached = set(newchildren)
+        if self.selected not in self.attached:
+            self.selected = None
+        self.schedule_redraw()
+        
+    def get_children(self, item=""):
+        """Get the attached rows in display order"""
+        return tuple(self.order)
+        
+    def selection(self):
+        """Get the selected row as a tuple, like Treeview"""
+        return (self.selected,) if self.selected is not None else ()
+        
+    def selection_set(self, iid):
+        """Select a row and notify listeners"""
+        self.selected = iid
+        self.schedule_redraw()
+        self.canvas.event_generate("<<TreeviewSelect>>")
+        
+    def yview(self, *args):
+        """Scrollbar protocol: report or change the visible fraction"""
+        visible = self.visible_rows()
+        max_top = max(0, len(self.order) - visible)
+        
+        if not args:
+            return self.view_fractions()
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.order))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (visible if args[2] == "pages" else 1)
+            self.top += step
+            
+        self.top = max(0, min(self.top, max_top))
+        self.schedule_redraw()
+        
+    def visible_rows(self):
+        """Number of rows that fit in the viewport"""
+        return max(1, self.canvas.winfo_height() // self.ROW_HEIGHT)
+        
+    def view_fractions(self):
+        """Visible (first, last) fractions of the row list"""
+        total = len(self.order)
+        if not total:
+            return 0.0, 1.0
+        return self.top / total, min(1.0, (self.top + self.visible_rows()) / total)
+        
+    def schedule_redraw(self):
+        """Coalesce many model changes into one redraw"""
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.canvas.after_idle(self.redraw)
+            
+    def clip(self, text, width):
+        """Truncate text to roughly fit a column"""
+        text = str(text)
+        max_chars = max(1, width // self.CHAR_WIDTH)
+        if len(text) > max_chars:
+            return text[:max_chars - 1] + "…"
+        return text
+        
+    def redraw(self):
+        """Draw the header and only the rows between first and last visible"""
+        self.redraw_pending = False
+        
+        self.header.delete("all")
+        x = 0
+        for col in self.columns:
+            width = self.widths[col]
+            self.header.create_rectangle(x, 0, x + width, self.HEADER_HEIGHT, fill="#e8e8e8", outline="#c0c0c0")
+            self.header.create_text(x + 4, self.HEADER_HEIGHT / 2, text=self.clip(self.headings[col], width),
+                                    anchor=tk.W)
+            x += width
+            
+        self.canvas.delete("all")
+        self.top = max(0, min(self.top, len(self.order) - self.visible_rows()))
+        first = self.top
+        last = min(len(self.order), first + self.visible_rows() + 1)
+        
+        for row, iid in enumerate(self.order[first:last]):
+            text, values = self.items[iid]
+            y = row * self.ROW_HEIGHT
+            tags = ("row", f"iid:{iid}")
+            fill = "#cce4ff" if iid == self.selected else "white"
+            self.canvas.create_rectangle(0, y, x, y + self.ROW_HEIGHT, fill=fill, outline="#f0f0f0", tags=tags)
+            
+            cell_x = 0
+            for col, value in zip(self.columns, (text,) + values):
+                width = self.widths[col]
+                self.canvas.create_text(cell_x + 4, y + self.ROW_HEIGHT / 2, text=self.clip(value, width),
+                                        anchor=tk.W, tags=tags)
+                cell_x += width
+                
+        if self.yscrollcommand:
+            self.yscrollcommand(*self.view_fractions())
+            
+    def on_click(self, event):
+        """Select the row under the pointer"""
+        if self.top + event.y // self.ROW_HEIGHT >= len(self.order):
+            return
+            
+        found = self.canvas.find_closest(event.x, event.y)
+        for tag in self.canvas.gettags(found[0]) if found else ():
+            if tag.startswith("iid:"):
+                self.selection_set(tag[4:])
+                return
+                
+    def on_header_click(self, event):
+        """Run the heading command of the clicked column"""
+        x = 0
+        for col in self.columns:
+            x += self.widths[col]
+            if event.x < x:
+                command = self.heading_commands.get(col)
+                if command:
+                    command()
+                return
+                
+    def on_mouse_wheel(self, event):
+        """Scroll three rows per wheel notch"""
+        self.yview("scroll", -3 if event.delta > 0 else 3, "units")
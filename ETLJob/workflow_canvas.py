@@ -5,19 +5,55 @@ Workflow Canvas - Visual drag-and-drop workflow designer
 import tkinter as tk
 from tkinter import ttk, messagebox
 import math
+from collections import defaultdict, deque
+
+
+# Job box fill per status (anything else is idle) and icon per job type
+_STATUS_COLOR = {'running': "orange", 'completed': "lightgreen", 'failed': "lightcoral"}
+_TYPE_ICON = {"python": "🐍", "shell": "💻", "sql": "📊"}
 
 
 class WorkflowCanvas:
     """Visual workflow designer with drag-and-drop"""
     
+    JOB_WIDTH = 120
+    JOB_HEIGHT = 40
+    
+    # Pixels drawn beyond each edge of the viewport, so small scrolls don't show gaps
+    VIEW_MARGIN = 64
+    
+    # Side of the square cells jobs are bucketed into for click hit-testing
+    HIT_CELL = 200
+    
+    # Below this zoom, or with more jobs than this in view, boxes are drawn without text
+    DETAIL_MIN_ZOOM = 0.5
+    DETAIL_MAX_JOBS = 200
+    
     def __init__(self, parent, job_manager):
         self.parent = parent
         self.job_manager = job_manager
         self.jobs = {}
         self.job_positions = {}
+        self.dependency_edges = []
         self.selected_job = None
         self.dragging = False
         self.drag_start = None
+        self.drag_edges = []
+        self.drag_drawn = None
+        self.drag_pending = False
+        self.zoom = 1.0
+        self.redraw_pending = False
+        
+        # Job IDs and dependency edges the last layout was computed from, and its result
+        self._layout_cache_key = None
+        self._layout_positions = {}
+        
+        # Derived from job_positions and rebuilt on demand after positions_changed()
+        self.hit_grid = None
+        self.arrow_boxes = None
+        
+        # Everything the last draw_workflow() depended on, to skip redraws that change nothing
+        self._drawn_key = None
         
         self.setup_ui()
         self.load_jobs()
@@ -40,8 +76,8 @@ class WorkflowCanvas:
         
         self.canvas = tk.Canvas(canvas_frame, bg="white", width=1000, height=600)
         
-        h_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
-        v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        h_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.xview)
+        v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.yview)
         
         self.canvas.configure(xscrollcommand=h_scrollbar.set, yscrollcommand=v_scrollbar.set)
         
@@ -57,6 +93,7 @@ class WorkflowCanvas:
         self.canvas.bind("<B1-Motion>", self.on_mouse_move)
         self.canvas.bind("<ButtonRelease-1>", self.on_mouse_up)
         self.canvas.bind("<Double-Button-1>", self.on_double_click)
+        self.canvas.bind("<Configure>", lambda e: self.schedule_redraw())
         
         # Legend
         legend_frame = ttk.LabelFrame(self.parent, text="Legend", padding=10)
@@ -71,6 +108,12 @@ class WorkflowCanvas:
     def load_jobs(self):
         """Load jobs from database"""
         self.jobs = {job['id']: job for job in self.job_manager.get_all_jobs()}
+        
+        # Shorten names for the boxes once per load rather than on every draw
+        for job in self.jobs.values():
+            name = job['name']
+            job['_display_name'] = name if len(name) <= 15 else name[:12] + "..."
+            
         self.auto_layout()
         
     def refresh(self):
@@ -82,159 +125,268 @@ class WorkflowCanvas:
         if not self.jobs:
             return
             
-        # Build dependency graph
-        graph = {}
-        in_degree = {}
-        
-        for job_id in self.jobs:
-            graph[job_id] = []
-            in_degree[job_id] = 0
+        # The layout depends only on the jobs and their edges; reuse it while both are unchanged
+        edges = self.dependency_edges = self.job_manager.get_all_dependency_edges()
+        key = (frozenset(self.jobs), frozenset(edges))
+        self.positions_changed()
+        if key == self._layout_cache_key:
+            self.job_positions = dict(self._layout_positions)
+            self.draw_workflow()
+            return
             
-        for job_id in self.jobs:
-            deps = self.job_manager.get_job_dependencies(job_id)
-            for dep in deps:
-                graph[dep['depends_on_job_id']].append(job_id)
-                in_degree[job_id] += 1
+        # Build the dependency graph over compact indices: parallel src/dst lists and the
+        # dependents of job i in targets[offsets[i]:offsets[i + 1]]
+        job_ids = sorted(self.jobs)
+        job_index = {job_id: i for i, job_id in enumerate(job_ids)}
+        count = len(job_ids)
+        src = []
+        dst = []
+        for job_id, dep_id in edges:
+            if job_id in job_index and dep_id in job_index:
+                src.append(job_index[dep_id])
+                dst.append(job_index[job_id])
                 
-        # Topological sort to determine levels
-        levels = {}
-        queue = [job_id for job_id in self.jobs if in_degree[job_id] == 0]
-        current_level = 0
-        
-        while queue:
-            next_queue = []
-            for job_id in queue:
-                levels[job_id] = current_level
-                for dependent in graph[job_id]:
-                    in_degree[dependent] -= 1
-                    if in_degree[dependent] == 0:
-                        next_queue.append(dependent)
-            queue = next_queue
-            current_level += 1
+        in_degree = [0] * count
+        offsets = [0] * (count + 1)
+        for s, d in zip(src, dst):
+            in_degree[d] += 1
+            offsets[s + 1] += 1
+        for i in range(count):
+            offsets[i + 1] += offsets[i]
+        targets = [0] * len(src)
+        fill = offsets[:count]
+        for s, d in zip(src, dst):
+            targets[fill[s]] = d
+            fill[s] += 1
             
-        # Position jobs based on levels
-        level_counts = {}
-        for job_id, level in levels.items():
-            level_counts[level] = level_counts.get(level, 0) + 1
-            
-        level_positions = {level: 0 for level in level_counts}
-        
         x_spacing = 200
         y_spacing = 120
         start_x = 100
         start_y = 100
         
+        # Topological sort, placing each job as it is dequeued: its level is the column
+        # and the jobs already placed in that level give the row. Jobs in a cycle are
+        # never dequeued and stay unplaced
         self.job_positions = {}
-        for job_id, level in sorted(levels.items(), key=lambda x: (x[1], x[0])):
+        level_positions = defaultdict(int)
+        queue = deque((i, 0) for i in range(count) if in_degree[i] == 0)
+        
+        while queue:
+            i, level = queue.popleft()
             x = start_x + level * x_spacing
             y = start_y + level_positions[level] * y_spacing
-            self.job_positions[job_id] = (x, y)
+            self.job_positions[job_ids[i]] = (x, y)
             level_positions[level] += 1
             
+            for dependent in targets[offsets[i]:offsets[i + 1]]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append((dependent, level + 1))
+                    
+        self._layout_cache_key = key
+        self._layout_positions = dict(self.job_positions)
         self.draw_workflow()
         
+    def positions_changed(self):
+        """Drop everything derived from job_positions"""
+        self.hit_grid = None
+        self.arrow_boxes = None
+        
+    def build_arrow_boxes(self):
+        """Collect (left, top, right, bottom, job_id, dep_id) of every drawable arrow"""
+        positions = self.job_positions
+        boxes = []
+        for job_id, dep_id in self.dependency_edges:
+            if job_id in positions and dep_id in positions:
+                x1, y1, x2, y2 = self.arrow_coords(job_id, dep_id)
+                boxes.append((min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2), job_id, dep_id))
+        self.arrow_boxes = boxes
+        
+    def build_hit_grid(self):
+        """Bucket job IDs by every HIT_CELL cell their box overlaps"""
+        cell = self.HIT_CELL
+        grid = {}
+        for job_id, (x, y) in self.job_positions.items():
+            for cx in range(int(x // cell), int((x + self.JOB_WIDTH) // cell) + 1):
+                for cy in range(int(y // cell), int((y + self.JOB_HEIGHT) // cell) + 1):
+                    grid.setdefault((cx, cy), []).append(job_id)
+        self.hit_grid = grid
+        
+    def job_at(self, canvas_x, canvas_y):
+        """ID of the job whose box contains the canvas point, or None"""
+        # Positions change on layout and drag, which drop the grid; it is rebuilt on the next click
+        if self.hit_grid is None:
+            self.build_hit_grid()
+            
+        x = canvas_x / self.zoom
+        y = canvas_y / self.zoom
+        for job_id in self.hit_grid.get((int(x // self.HIT_CELL), int(y // self.HIT_CELL)), ()):
+            left, top = self.job_positions[job_id]
+            if left <= x <= left + self.JOB_WIDTH and top <= y <= top + self.JOB_HEIGHT:
+                return job_id
+        return None
+        
+    def xview(self, *args):
+        """Horizontal scrollbar command; redraws so newly exposed jobs appear"""
+        self.canvas.xview(*args)
+        self.schedule_redraw()
+        
+    def yview(self, *args):
+        """Vertical scrollbar command; redraws so newly exposed jobs appear"""
+        self.canvas.yview(*args)
+        self.schedule_redraw()
+        
+    def schedule_redraw(self):
+        """Coalesce resizes and scrolls into one redraw"""
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.canvas.after_idle(self.draw_workflow)
+            
+    def visible_area(self):
+        """Unzoomed (x1, y1, x2, y2) of the viewport, widened by VIEW_MARGIN"""
+        margin = self.VIEW_MARGIN
+        x1 = self.canvas.canvasx(0) - margin
+        y1 = self.canvas.canvasy(0) - margin
+        x2 = self.canvas.canvasx(self.canvas.winfo_width()) + margin
+        y2 = self.canvas.canvasy(self.canvas.winfo_height()) + margin
+        return x1 / self.zoom, y1 / self.zoom, x2 / self.zoom, y2 / self.zoom
+        
     def draw_workflow(self):
-        """Draw the workflow on canvas"""
+        """Draw the jobs and arrows inside the viewport"""
+        self.redraw_pending = False
+        
+        # Only items intersecting the visible area are created
+        area = self.visible_area()
+        left, top, right, bottom = area
+        
+        # Leave the canvas alone if the view, the layout and every job's look are as last drawn
+        key = (area, self.zoom, tuple(self.job_positions.items()), tuple(self.dependency_edges),
+               tuple((job_id, job['status'], job['enabled'], job['job_type'], job['_display_name'])
+                     for job_id, job in self.jobs.items()))
+        if key == self._drawn_key:
+            return
+        self._drawn_key = key
+        
         self.canvas.delete("all")
         
-        # Draw dependency arrows first (so they're behind jobs)
-        for job_id in self.jobs:
-            if job_id in self.job_positions:
-                deps = self.job_manager.get_job_dependencies(job_id)
-                for dep in deps:
-                    dep_id = dep['depends_on_job_id']
-                    if dep_id in self.job_positions:
-                        x1, y1 = self.job_positions[dep_id]
-                        x2, y2 = self.job_positions[job_id]
-                        
-                        # Draw arrow
-                        self.canvas.create_line(
-                            x1 + 60, y1 + 20, x2, y2 + 20,
-                            arrow=tk.LAST,
-                            fill="gray",
-                            width=2,
-                            tags="arrow"
-                        )
-                        
+        # Draw dependency arrows first (so they're behind jobs), from the edges
+        # auto_layout() read; their boxes are kept between scrolls and zooms
+        if self.arrow_boxes is None:
+            self.build_arrow_boxes()
+        for x1, y1, x2, y2, job_id, dep_id in self.arrow_boxes:
+            if x2 >= left and x1 <= right and y2 >= top and y1 <= bottom:
+                self.draw_arrow(job_id, dep_id)
+                
         # Draw jobs
+        positions = self.job_positions
+        width, height = self.JOB_WIDTH, self.JOB_HEIGHT
+        visible = []
         for job_id, job in self.jobs.items():
-            if job_id in self.job_positions:
-                x, y = self.job_positions[job_id]
-                self.draw_job(job_id, job, x, y)
-                
-    def draw_job(self, job_id, job, x, y):
-        """Draw a single job box"""
-        width = 120
-        height = 40
+            if job_id in positions:
+                x, y = positions[job_id]
+                if x + width >= left and x <= right and y + height >= top and y <= bottom:
+                    visible.append((job_id, job, x, y))
+                    
+        # Text costs more to draw than the boxes and is unreadable when small or crowded
+        detailed = self.zoom >= self.DETAIL_MIN_ZOOM and len(visible) <= self.DETAIL_MAX_JOBS
+        for job_id, job, x, y in visible:
+            self.draw_job(job_id, job, x, y, detailed)
+                    
+    def arrow_coords(self, job_id, dep_id):
+        """Unzoomed (x1, y1, x2, y2) of the arrow from dep_id to job_id"""
+        x1, y1 = self.job_positions[dep_id]
+        x2, y2 = self.job_positions[job_id]
+        return x1 + 60, y1 + 20, x2, y2 + 20
+        
+    def draw_arrow(self, job_id, dep_id):
+        """Draw the arrow from dep_id to job_id at the current zoom"""
+        zoom = self.zoom
+        self.canvas.create_line(
+            *[c * zoom for c in self.arrow_coords(job_id, dep_id)],
+            arrow=tk.LAST,
+            fill="gray",
+            width=2,
+            tags=("arrow", f"arrow_{dep_id}_{job_id}")
+        )
+        
+    def font_size(self, points):
+        """Font size for text of the given size at the current zoom"""
+        # Tk treats size 0 as its default font size, so never go below 1
+        return max(1, round(points * self.zoom))
+        
+    def draw_job(self, job_id, job, x, y, detailed=True):
+        """Draw a single job box at unzoomed position (x, y), with its name and icons if detailed"""
+        # Positions are kept unzoomed; coordinates and fonts are scaled as they are drawn
+        zoom = self.zoom
+        x *= zoom
+        y *= zoom
+        width = self.JOB_WIDTH * zoom
+        height = self.JOB_HEIGHT * zoom
         
         # Determine color based on status
-        status = job['status']
-        if status == 'running':
-            color = "orange"
-        elif status == 'completed':
-            color = "lightgreen"
-        elif status == 'failed':
-            color = "lightcoral"
-        else:
-            color = "lightblue"
-            
+        color = _STATUS_COLOR.get(job['status'], "lightblue")
+        
         # Draw box
         box = self.canvas.create_rectangle(
             x, y, x + width, y + height,
             fill=color,
             outline="black",
             width=2,
-            tags=f"job_{job_id}"
+            tags=(f"job_{job_id}", f"jobrect_{job_id}")
         )
         
+        if not detailed:
+            return
+            
         # Draw enabled indicator
         if not job['enabled']:
             self.canvas.create_text(
-                x + 10, y + 10,
+                x + 10 * zoom, y + 10 * zoom,
                 text="⏸",
-                font=("Arial", 12),
+                font=("Arial", self.font_size(12)),
                 anchor=tk.NW,
                 tags=f"job_{job_id}"
             )
             
         # Draw job name
-        name = job['name']
-        if len(name) > 15:
-            name = name[:12] + "..."
-            
         self.canvas.create_text(
             x + width / 2, y + height / 2,
-            text=name,
-            font=("Arial", 10, "bold"),
+            text=job['_display_name'],
+            font=("Arial", self.font_size(10), "bold"),
             tags=f"job_{job_id}"
         )
         
         # Draw job type indicator
-        type_icon = {"python": "🐍", "shell": "💻", "sql": "📊"}.get(job['job_type'], "")
+        type_icon = _TYPE_ICON.get(job['job_type'], "")
         self.canvas.create_text(
-            x + width - 15, y + 10,
+            x + width - 15 * zoom, y + 10 * zoom,
             text=type_icon,
-            font=("Arial", 12),
+            font=("Arial", self.font_size(12)),
             anchor=tk.NE,
             tags=f"job_{job_id}"
         )
         
+    def update_job_status(self, job_id, status):
+        """Recolor one job's box in place after its status changed"""
+        job = self.jobs.get(job_id)
+        if job is None or job['status'] == status:
+            return
+        job['status'] = status
+        self.canvas.itemconfigure(f"jobrect_{job_id}", fill=_STATUS_COLOR.get(status, "lightblue"))
+        
     def on_mouse_down(self, event):
         """Handle mouse down event"""
         canvas_x = self.canvas.canvasx(event.x)
         canvas_y = self.canvas.canvasy(event.y)
         
         # Find clicked job
-        items = self.canvas.find_overlapping(canvas_x - 2, canvas_y - 2, canvas_x + 2, canvas_y + 2)
-        for item in items:
-            tags = self.canvas.gettags(item)
-            for tag in tags:
-                if tag.startswith("job_"):
-                    job_id = int(tag.split("_")[1])
-                    self.selected_job = job_id
-                    self.dragging = True
-                    self.drag_start = (canvas_x, canvas_y)
-                    return
+        job_id = self.job_at(canvas_x, canvas_y)
+        if job_id is not None:
+            self.selected_job = job_id
+            self.dragging = True
+            self.drag_start = (canvas_x, canvas_y)
+            self.drag_edges = [edge for edge in self.dependency_edges if job_id in edge]
+            self.drag_drawn = self.job_positions[job_id]
                     
     def on_mouse_move(self, event):
         """Handle mouse move event"""
@@ -242,20 +394,58 @@ class WorkflowCanvas:
             canvas_x = self.canvas.canvasx(event.x)
             canvas_y = self.canvas.canvasy(event.y)
             
-            dx = canvas_x - self.drag_start[0]
-            dy = canvas_y - self.drag_start[1]
+            dx = (canvas_x - self.drag_start[0]) / self.zoom
+            dy = (canvas_y - self.drag_start[1]) / self.zoom
             
             # Move job
             old_x, old_y = self.job_positions[self.selected_job]
             self.job_positions[self.selected_job] = (old_x + dx, old_y + dy)
-            
+            self.positions_changed()
             self.drag_start = (canvas_x, canvas_y)
-            self.draw_workflow()
             
+            # A burst of motion events between two idle points is drawn once
+            if not self.drag_pending:
+                self.drag_pending = True
+                self.canvas.after_idle(self.draw_drag)
+                
+    def draw_drag(self):
+        """Bring the dragged job and its arrows up to its current position"""
+        if not self.drag_pending:
+            return
+        self.drag_pending = False
+        
+        # Shift only the dragged job's items and reroute its own arrows;
+        # everything else is left alone until the drag ends
+        positions = self.job_positions
+        zoom = self.zoom
+        x, y = positions[self.selected_job]
+        drawn_x, drawn_y = self.drag_drawn
+        self.canvas.move(f"job_{self.selected_job}", (x - drawn_x) * zoom, (y - drawn_y) * zoom)
+        self.drag_drawn = (x, y)
+        
+        for job_id, dep_id in self.drag_edges:
+            if job_id in positions and dep_id in positions:
+                coords = [c * zoom for c in self.arrow_coords(job_id, dep_id)]
+                self.canvas.coords(f"arrow_{dep_id}_{job_id}", *coords)
+                
     def on_mouse_up(self, event):
         """Handle mouse up event"""
+        # Catch up with motion not drawn yet
+        self.draw_drag()
+        
+        # Only the dragged job's arrows changed, so recreate just those (ones culled before
+        # the drag may now be in view) and leave every other item as it is
+        if self.dragging:
+            positions = self.job_positions
+            for job_id, dep_id in self.drag_edges:
+                tag = f"arrow_{dep_id}_{job_id}"
+                self.canvas.delete(tag)
+                if job_id in positions and dep_id in positions:
+                    self.draw_arrow(job_id, dep_id)
+            self.canvas.tag_lower("arrow")
         self.dragging = False
         self.drag_start = None
+        self.drag_edges = []
         
     def on_double_click(self, event):
         """Handle double click event"""
@@ -263,14 +453,9 @@ class WorkflowCanvas:
         canvas_y = self.canvas.canvasy(event.y)
         
         # Find clicked job
-        items = self.canvas.find_overlapping(canvas_x - 2, canvas_y - 2, canvas_x + 2, canvas_y + 2)
-        for item in items:
-            tags = self.canvas.gettags(item)
-            for tag in tags:
-                if tag.startswith("job_"):
-                    job_id = int(tag.split("_")[1])
-                    self.edit_job(job_id)
-                    return
+        job_id = self.job_at(canvas_x, canvas_y)
+        if job_id is not None:
+            self.edit_job(job_id)
                     
     def edit_job(self, job_id):
         """Open job edit dialog"""
@@ -278,8 +463,10 @@ class WorkflowCanvas:
         
     def zoom_in(self):
         """Zoom in on canvas"""
-        self.canvas.scale("all", 0, 0, 1.2, 1.2)
+        self.zoom *= 1.2
+        self.draw_workflow()
         
     def zoom_out(self):
         """Zoom out on canvas"""
-        self.canvas.scale("all", 0, 0, 0.8, 0.8)
\ No newline at end of file
+        self.zoom *= 0.8
+        self.draw_workflow()
\ No newline at end of file
